@@ -1,7 +1,9 @@
 """Continuous analysis engine that runs always-on and pushes updates via callback.
 
 This module intentionally keeps synchronous MT5 calls off the main thread
-by using a Thread + asyncio event loop and run_in_executor for IO.
+by using a Thread + asyncio event loop and run_in_executor for IO. Callers that
+already run an event loop (the web UI) can instead await start_async() and
+keep the whole engine on their loop.
 """
 from __future__ import annotations
 
@@ -32,21 +34,33 @@ class AnalysisEngine:
       engine = AnalysisEngine()
       engine.start(symbol, timeframe, history_days=7, poll_interval=30, update_cb=callable)
       engine.stop()
+
+    Or, from inside a running event loop:
+      asyncio.create_task(engine.start_async(symbol, timeframe, update_cb=callable))
     """
 
-    def __init__(self):
+    def __init__(self, market_data: Optional[MarketDataManager] = None):
         self.logger = get_logger()
-        self._md = MarketDataManager()
+        # Callers serving other requests pass their manager so the cache and
+        # in-flight fetches are shared with the engine
+        self._md = market_data if market_data is not None else MarketDataManager()
         self._analyzer: Optional[ForexAnalyzer] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
         self._last_hist_end = None
         self._full_refresh_minutes = 60
         self._last_full_refresh = None
 
+    def is_running(self) -> bool:
+        """Return True while the engine runs, on its own thread or a caller's loop."""
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        return self._task is not None and not self._task.done()
+
     def start(self, symbol: str, timeframe: str, history_days: int = 7, poll_interval: int = 30, update_cb: Optional[Callable] = None):
-        if self._thread and self._thread.is_alive():
+        if self.is_running():
             self.logger.info("Analysis engine already running")
             return
 
@@ -75,8 +89,34 @@ class AnalysisEngine:
         self._thread.start()
         self.logger.info(f"Started analysis engine for {symbol} {timeframe}")
 
+    async def start_async(self, symbol: str, timeframe: str, history_days: int = 7, poll_interval: int = 30, update_cb: Optional[Callable] = None):
+        """Run the engine on the current event loop until stop() is called.
+
+        Only the blocking MT5 fetch and the analysis itself go to the loop's
+        executor; update_cb is invoked on the loop thread, so results need no
+        cross-thread hand-off.
+        """
+        if self.is_running():
+            self.logger.info("Analysis engine already running")
+            return
+
+        self._stop_event.clear()
+        self._analyzer = ForexAnalyzer(symbol, timeframe)
+        self._task = asyncio.current_task()
+        self.logger.info(f"Started analysis engine for {symbol} {timeframe} on the running event loop")
+        try:
+            await self._main_loop(symbol, timeframe, history_days, poll_interval, update_cb)
+        except asyncio.CancelledError:
+            self.logger.info('Analysis engine task cancelled, exiting')
+        finally:
+            self._task = None
+
     def stop(self):
         self._stop_event.set()
+        task = self._task
+        if task is not None and not task.done():
+            # Safe from any thread; the task exits at its next await
+            task.get_loop().call_soon_threadsafe(task.cancel)
         if self._loop and self._loop.is_running():
             # stop the loop safely
             self._loop.call_soon_threadsafe(self._loop.stop)
@@ -117,24 +157,18 @@ class AnalysisEngine:
                     need_full = True
 
                 if need_full:
-                    hist_df = await loop.run_in_executor(None, lambda: self._md.get_candles(symbol, timeframe, count))
+                    hist_df = await self._md.get_candles_async(symbol, timeframe, count)
                     self._last_full_refresh = datetime.utcnow()
                 else:
                     # Only fetch most recent candles to update the cache / current slice
                     recent_count = max(100, int(min(500, count * 0.05)))
-                    recent = await loop.run_in_executor(None, lambda: self._md.get_candles(symbol, timeframe, recent_count))
+                    recent = await self._md.get_candles_async(symbol, timeframe, recent_count)
                     # Merge recent with cache
                     if cached is not None:
                         df_combined = pd.concat([cached, recent]).drop_duplicates(subset=['Timestamp']).sort_values('Timestamp').reset_index(drop=True)
                         hist_df = df_combined
                         # update cache
-                        try:
-                            if symbol not in self._md._data_cache:
-                                self._md._data_cache[symbol] = {}
-                            self._md._data_cache[symbol][timeframe] = MarketDataManager.CacheEntry(df_combined, timeframe)
-                        except Exception:
-                            # fallback if CacheEntry not accessible
-                            self._md._data_cache[symbol][timeframe] = df_combined
+                        self._md.update_cache(symbol, timeframe, df_combined)
                     else:
                         hist_df = recent
 
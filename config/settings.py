@@ -31,6 +31,11 @@ SYMBOL_CONFIG = {
     'cache_duration_seconds': 3600,
     'auto_refresh_on_account_change': True,
     'invalid_until_reconnect_timeout': 30,  # Seconds to wait before retrying invalid symbols
+    'info_cache_ttl_seconds': 0.5,  # Reuse symbol_info results for this long (0 disables)
+    'info_cache_max_entries': 256,  # Least recently used symbol_info entries are evicted beyond this
+    'callback_workers': 4,  # Threads used to run refresh callbacks concurrently
+    'callback_timeout_seconds': 5,  # Max wait per refresh callback before logging it as failed
+    'symbols_reuse_seconds': 0.1,  # Back-to-back symbols_get calls within this window share one result
 }
 
 # Logging settings
@@ -71,6 +76,9 @@ PATTERN_EVAL_CONFIG = {
 PERFORMANCE_CONFIG = {
     'enable_caching': True,
     'cache_staleness_factor': 1.5,  # Multiply timeframe minutes to determine staleness
+    'max_cache_entries': 256,  # Max (symbol, timeframe) candle sets held in memory (LRU eviction)
+    'price_dtype': 'float64',  # OHLC dtype; 'float32' halves memory but keeps only ~7 significant digits
+    'cache_dir': None,  # Directory for on-disk parquet candle cache (None = memory only, needs pyarrow)
     'parallel_timeframe_fetch': True,
     'batch_size_analysis': 5,  # Max symbols to analyze in parallel
     'ui_update_interval': 1.0,  # Seconds between UI updates
@@ -84,6 +92,9 @@ UI_CONFIG = {
     'show_confluence_details': True,
     'show_top_factors': True,
     'colorized_output': True,
+    # Web UI: run the analysis engine as a task on the server's event loop
+    # rather than on its own thread and loop
+    'web_engine_in_server_loop': True,
 }
 
 # Robustness settings
@@ -106,5 +117,7 @@ SAFETY_CONFIG = {
     'prevent_order_functions': True,  # Block order-related MT5 functions
     'prevent_account_modifications': True,  # Block account-modifying operations
     'log_all_account_access': True,  # Log every account info access
+    'access_log_batch_size': 64,  # Account access entries per batched log record
+    'access_log_flush_seconds': 1.0,  # Flush queued entries on the next access once this old (else at exit)
 }
 
@@ -1,6 +1,9 @@
 """Structured logging for the Strelitzia Trader application with verbosity control."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from typing import Optional
@@ -29,7 +32,11 @@ class ColoredFormatter(logging.Formatter):
 
     def format(self, record):
         color = self.COLORS.get(record.levelname, self.RESET)
+        # Colour a copy: the record is shared with the file handler, and its
+        # %-style args have already been merged into the message here
+        record = logging.makeLogRecord(record.__dict__)
         record.msg = f"{color}{record.getMessage()}{self.RESET}"
+        record.args = None
         return super().format(record)
 
 
@@ -41,6 +48,7 @@ class Logger:
     _verbosity: LogVerbosity = LogVerbosity.STANDARD
     _console_handler: Optional[logging.StreamHandler] = None
     _file_handler: Optional[logging.FileHandler] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -70,8 +78,17 @@ class Logger:
         self._file_handler.setFormatter(file_formatter)
         self._file_handler.setLevel(logging.DEBUG)
 
-        self._logger.addHandler(self._console_handler)
-        self._logger.addHandler(self._file_handler)
+        # Callers (including the web UI's event loop) only enqueue records; a
+        # listener thread formats and writes them to the console and file
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, self._console_handler, self._file_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        # Drains anything still queued on interpreter exit
+        atexit.register(self._listener.stop)
         
         # Set initial verbosity
         self.set_verbosity(LogVerbosity.STANDARD)
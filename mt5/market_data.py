@@ -1,20 +1,59 @@
 """Market data retrieval from MT5."""
 
+import asyncio
+import hashlib
+import os
+import tempfile
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from threading import Event, Lock, RLock, Thread
+from typing import Optional, Dict, List, Sequence, Tuple
 from core.logger import get_logger
+from config.settings import PERFORMANCE_CONFIG
+
+# Optional: pyarrow backs the on-disk parquet cache tier
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Copy-on-Write lets cache hits hand out shallow copies that only copy data
+# when a caller writes to them. It is always enabled from pandas 3.0.
+# NOTE: this is a global pandas option, so importing this module switches the
+# whole process to Copy-on-Write semantics, not just the frames built here.
+if int(pd.__version__.split('.')[0]) < 3:
+    try:
+        pd.set_option('mode.copy_on_write', True)
+    except KeyError:
+        pass
 
 
 class CacheEntry:
     """Cache entry with metadata for intelligent invalidation."""
+
+    __slots__ = ('data', 'timeframe', 'timestamp', 'last_candle_time', 'state_key')
     
-    def __init__(self, data: pd.DataFrame, timeframe: str):
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        timeframe: str,
+        timestamp: Optional[datetime] = None,
+        state_key: Optional[bytes] = None
+    ):
         self.data = data
         self.timeframe = timeframe
-        self.timestamp = datetime.now()
-        self.last_candle_time = data['Timestamp'].iloc[-1] if len(data) > 0 else None
+        self.timestamp = timestamp or datetime.now()
+        self.state_key = state_key
+        # Kept as numpy.datetime64 so is_stale never boxes a pd.Timestamp
+        timestamps = data['Timestamp'].to_numpy(copy=False)
+        self.last_candle_time = timestamps[-1] if timestamps.size else None
     
     def is_stale(self, current_time: datetime, timeframe_minutes: int) -> bool:
         """Check if cache is stale based on the latest candle time."""
@@ -22,8 +61,8 @@ class CacheEntry:
             return True
         
         # Data is stale if latest candle is older than 1.5x the timeframe
-        threshold = timedelta(minutes=timeframe_minutes * 1.5)
-        return (current_time - self.last_candle_time) > threshold
+        threshold = np.timedelta64(int(timeframe_minutes * 1.5 * 60), 's')
+        return (np.datetime64(current_time) - self.last_candle_time) > threshold
 
 
 class MarketDataManager:
@@ -42,6 +81,31 @@ class MarketDataManager:
         'MN1': mt5.TIMEFRAME_MN1,
     }
     
+    # DataFrame column -> MT5 rates field
+    RATE_FIELDS = {
+        'Timestamp': 'time',
+        'Open': 'open',
+        'High': 'high',
+        'Low': 'low',
+        'Close': 'close',
+        'Volume': 'tick_volume',
+        'RealVolume': 'real_volume',
+        'Spread': 'spread',
+    }
+
+    # Leaner column set for callers that never read RealVolume/Spread
+    CORE_COLUMNS = ('Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume')
+
+    # Columns validate_data requires to be present and NaN-free
+    REQUIRED = ('Open', 'High', 'Low', 'Close', 'Volume')
+    REQUIRED_SET = frozenset(REQUIRED)
+
+    # Latest candle age beyond which check_data_sufficiency reports stale data
+    STALE_DATA_SECONDS = 24 * 60 * 60
+
+    # Price columns forward-filled by handle_missing_data
+    PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
     # Timeframe to minutes mapping for cache staleness
     TIMEFRAME_MINUTES = {
         'M1': 1,
@@ -55,12 +119,88 @@ class MarketDataManager:
         'MN1': 43200,
     }
 
-    def __init__(self):
-        """Initialize market data manager."""
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize market data manager.
+        
+        Args:
+            cache_dir: Directory for the on-disk parquet cache. Defaults to
+                PERFORMANCE_CONFIG['cache_dir']; None keeps the cache in memory only.
+        """
         self.logger = get_logger()
-        self._data_cache: Dict[str, Dict[str, CacheEntry]] = {}
-
-    def get_candles(self, symbol: str, timeframe: str, count: int = 500, force_refresh: bool = False) -> Optional[pd.DataFrame]:
+        # LRU cache keyed by (symbol, timeframe), most recently used last
+        self._data_cache: OrderedDict[Tuple[str, str], CacheEntry] = OrderedDict()
+        self._cache_lock = RLock()
+        self._max_cache_entries: int = PERFORMANCE_CONFIG.get('max_cache_entries', 256)
+        self._digits_cache: Dict[str, int] = {}
+        # float32 halves price memory but only holds ~7 significant digits
+        self._price_dtype = np.dtype(PERFORMANCE_CONFIG.get('price_dtype', 'float64'))
+        # Fetches in progress, so concurrent duplicate requests share one MT5 call
+        self._inflight: Dict[Tuple[str, str, int, Optional[Tuple[str, ...]]], Future] = {}
+        self._inflight_lock = Lock()
+        # Background cache warming for subscribed (symbol, timeframe) pairs
+        self._subscriptions: Dict[Tuple[str, str], int] = {}
+        self._subscriptions_lock = Lock()
+        self._refresher: Optional[Thread] = None
+        self._refresher_stop = Event()
+
+        if cache_dir is None:
+            cache_dir = PERFORMANCE_CONFIG.get('cache_dir')
+        self._cache_dir: Optional[Path] = None
+        if cache_dir is not None:
+            if PYARROW_AVAILABLE:
+                self._cache_dir = Path(cache_dir)
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                self._load_persisted_cache()
+            else:
+                self.logger.warning("pyarrow not installed - on-disk candle cache disabled")
+
+    @classmethod
+    def _rates_to_df(
+        cls,
+        rates: np.ndarray,
+        columns: Optional[Sequence[str]] = None,
+        price_dtype: Optional[np.dtype] = None
+    ) -> pd.DataFrame:
+        """
+        Build an OHLCV DataFrame directly from an MT5 rates array.
+        
+        Columns are taken as views of the structured array under their final
+        names, so no rename/reindex copies are made. MT5 returns rates in
+        ascending time order, so sorting only happens if that check fails.
+        
+        Args:
+            rates: Structured array returned by copy_rates_*
+            columns: Columns to build (default: all of RATE_FIELDS)
+            price_dtype: dtype for Open/High/Low/Close (default: MT5's float64)
+            
+        Returns:
+            pd.DataFrame: OHLCV data.
+        """
+        if columns is None:
+            columns = cls.RATE_FIELDS
+        data = {}
+        for col in columns:
+            field = rates[cls.RATE_FIELDS[col]]
+            if col == 'Timestamp':
+                field = field.astype('datetime64[s]')
+            elif price_dtype is not None and col in cls.PRICE_COLUMNS:
+                field = field.astype(price_dtype, copy=False)
+            data[col] = field
+        df = pd.DataFrame(data, copy=False)
+
+        if not df['Timestamp'].is_monotonic_increasing:
+            df = df.sort_values('Timestamp', kind='mergesort', ignore_index=True)
+        return df
+
+    def get_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        count: int = 500,
+        force_refresh: bool = False,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Retrieve candle data from MT5 with intelligent caching.
         
@@ -69,335 +209,425 @@ class MarketDataManager:
             timeframe: Timeframe string (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
             count: Number of candles to retrieve
             force_refresh: Force refresh even if cached
+            columns: Columns to return, e.g. CORE_COLUMNS (default: all).
+                Timestamp is always included.
             
         Returns:
             Optional[pd.DataFrame]: OHLCV data or None if error.
         """
         try:
-            if timeframe not in self.TIMEFRAME_MAP:
+            info = _TF_INFO.get(timeframe)
+            if info is None:
                 self.logger.error(f"Invalid timeframe: {timeframe}")
                 return None
-
-            # Check cache first
+            tf, tf_minutes = info
+            if columns is not None:
+                columns = tuple(dict.fromkeys(('Timestamp', *columns)))
+            state_key = self._cache_key(symbol, timeframe)
+
+            # Check cache first. With a tick available the state key alone decides:
+            # unchanged means no tick since caching (current however old), changed
+            # means the forming candle moved and the tail must be refreshed. The
+            # wall-clock staleness rule only applies when MT5 returns no tick.
+            cache_entry = None
             if not force_refresh:
-                cached = self.get_cached_data(symbol, timeframe)
-                if cached is not None:
-                    tf_minutes = self.TIMEFRAME_MINUTES.get(timeframe, 60)
-                    cache_entry = self._data_cache.get(symbol, {}).get(timeframe)
-                    
-                    if cache_entry and not cache_entry.is_stale(datetime.now(), tf_minutes):
-                        self.logger.debug(f"Using cached data for {symbol} {timeframe}")
-                        return cached
-
-            tf = self.TIMEFRAME_MAP[timeframe]
-
-            # Get candle data
-            rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
-            if rates is None or len(rates) == 0:
-                self.logger.warning(f"No data retrieved for {symbol} {timeframe}")
-                return None
-
-            # Convert to DataFrame
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            df = df.rename(columns={
-                'time': 'Timestamp',
-                'open': 'Open',
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'tick_volume': 'Volume',
-                'real_volume': 'RealVolume',
-                'spread': 'Spread',
-            })
-
-            df = df[['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume', 'RealVolume', 'Spread']]
-            df = df.sort_values('Timestamp').reset_index(drop=True)
-
-            # Cache the data with error handling
-            try:
-                if symbol not in self._data_cache:
-                    self._data_cache[symbol] = {}
-                self._data_cache[symbol][timeframe] = CacheEntry(df, timeframe)
-                self.logger.debug(f"Cached {len(df)} candles for {symbol} {timeframe}")
-            except Exception as cache_error:
-                self.logger.warning(f"Failed to cache data for {symbol} {timeframe}: {cache_error}")
-                # Continue without caching - don't fail the whole operation
-
-            self.logger.debug(f"Retrieved {len(df)} candles for {symbol} {timeframe}")
-            return df
+                cache_entry = self._lookup(symbol, timeframe)
+                # A cached frame missing any requested column cannot serve this call
+                if cache_entry is not None and not set(columns or self.RATE_FIELDS).issubset(cache_entry.data.columns):
+                    cache_entry = None
+                # Nor can one holding fewer bars than requested (it is not passed on
+                # either: _refresh_tail could not extend it backwards)
+                if cache_entry is not None and len(cache_entry.data) < count:
+                    cache_entry = None
+                if cache_entry is not None and (
+                    cache_entry.state_key == state_key if state_key is not None
+                    else not cache_entry.is_stale(datetime.now(), tf_minutes)
+                ):
+                    self.logger.debug(f"Using cached data for {symbol} {timeframe}")
+                    return self._select_columns(cache_entry.data, columns, count)
+
+            df = self._fetch_shared(symbol, timeframe, tf, count, cache_entry, state_key, columns)
+            return self._select_columns(df, columns, count) if df is not None else None
 
         except Exception as e:
             self.logger.error(f"Error retrieving candles for {symbol} {timeframe}: {e}")
             return None
 
-    def get_candles_from_date(self, symbol: str, timeframe: str, start_date: datetime) -> Optional[pd.DataFrame]:
+    async def get_candles_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        count: int = 500,
+        force_refresh: bool = False
+    ) -> Optional[pd.DataFrame]:
         """
-        Retrieve candle data from a specific date.
+        Retrieve candle data without blocking the event loop.
+        
+        The MT5 call runs in the loop's default executor; concurrent identical
+        requests share a single fetch (see get_candles).
         
         Args:
             symbol: Symbol name
             timeframe: Timeframe string
-            start_date: Start date for data retrieval
+            count: Number of candles to retrieve
+            force_refresh: Force refresh even if cached
             
         Returns:
             Optional[pd.DataFrame]: OHLCV data or None if error.
         """
-        try:
-            if timeframe not in self.TIMEFRAME_MAP:
-                self.logger.error(f"Invalid timeframe: {timeframe}")
-                return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.get_candles(symbol, timeframe, count, force_refresh)
+        )
 
-            tf = self.TIMEFRAME_MAP[timeframe]
+    def _fetch_shared(
+        self,
+        symbol: str,
+        timeframe: str,
+        tf: int,
+        count: int,
+        cache_entry: Optional[CacheEntry],
+        state_key: Optional[bytes],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Run _fetch_candles, or join an identical fetch already in progress."""
+        key = (symbol, timeframe, count, columns)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            self.logger.debug(f"Waiting on in-flight fetch for {symbol} {timeframe}")
+            return future.result()
 
-            # Get candle data from date
-            rates = mt5.copy_rates_from(symbol, tf, start_date, 500)
+        try:
+            df = self._fetch_candles(symbol, timeframe, tf, count, cache_entry, state_key, columns)
+            future.set_result(df)
+        except Exception as fetch_error:
+            future.set_exception(fetch_error)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return df
+
+    def _fetch_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        tf: int,
+        count: int,
+        cache_entry: Optional[CacheEntry],
+        state_key: Optional[bytes],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch candles from MT5 (incrementally if a stale entry exists) and cache them.
+        
+        The cached frame may hold more than count rows; callers slice the tail.
+        """
+        # Stale cache: fetch only the candles added since it was cached
+        df = None
+        if cache_entry is not None:
+            df = self._refresh_tail(symbol, timeframe, count, cache_entry)
+        # Tail refreshes fire on every tick change, so only full fetches hit the disk
+        full_fetch = df is None
+
+        if df is None:
+            # A short full fetch must not replace a longer cached history that
+            # other callers (e.g. the engine's full-history window) rely on
+            current = self._lookup(symbol, timeframe)
+            # Get candle data
+            rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
             if rates is None or len(rates) == 0:
-                self.logger.warning(f"No data retrieved for {symbol} from {start_date}")
+                self.logger.warning(f"No data retrieved for {symbol} {timeframe}")
                 return None
 
             # Convert to DataFrame
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            df = df.rename(columns={
-                'time': 'Timestamp',
-                'open': 'Open',
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'tick_volume': 'Volume',
-                'real_volume': 'RealVolume',
-                'spread': 'Spread',
-            })
-
-            df = df[['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume', 'RealVolume', 'Spread']]
-            df = df.sort_values('Timestamp').reset_index(drop=True)
-
-            self.logger.debug(f"Retrieved {len(df)} candles for {symbol} from {start_date}")
-            return df
-
-        except Exception as e:
-            self.logger.error(f"Error retrieving candles for {symbol} from {start_date}: {e}")
-            return None
+            df = self._rates_to_df(rates, columns=columns, price_dtype=self._price_dtype)
+            if current is not None and len(df) < len(current.data):
+                self.logger.debug(f"Retrieved {len(df)} candles for {symbol} {timeframe} (cache kept)")
+                return df
 
-    def get_multiple_timeframes(
-        self,
-        symbol: str,
-        timeframes: List[str],
-        count: int = 500
-    ) -> Dict[str, Optional[pd.DataFrame]]:
-        """
-        Retrieve candles for multiple timeframes simultaneously.
+        # Cache the data with error handling
+        try:
+            entry = CacheEntry(df, timeframe, state_key=state_key)
+            self._store(symbol, timeframe, entry)
+            self.logger.debug(f"Cached {len(df)} candles for {symbol} {timeframe}")
+            if full_fetch and self._cache_dir is not None:
+                self._persist(symbol, timeframe, entry)
+        except Exception as cache_error:
+            self.logger.warning(f"Failed to cache data for {symbol} {timeframe}: {cache_error}")
+            # Continue without caching - don't fail the whole operation
+
+        self.logger.debug(f"Retrieved {len(df)} candles for {symbol} {timeframe}")
+        return df
+
+    @staticmethod
+    def _select_columns(
+        df: pd.DataFrame,
+        columns: Optional[Tuple[str, ...]],
+        count: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Get a copy-on-write view of df limited to the requested columns and last count rows."""
+        if count is not None and len(df) > count:
+            df = df.iloc[-count:].reset_index(drop=True)
+        if columns is None or len(columns) == len(df.columns):
+            return df.copy(deep=False)
+        return df[list(columns)]
+
+    def _cache_key(self, symbol: str, timeframe: str) -> Optional[bytes]:
+        """
+        Build a state key for cached candles from the symbol/timeframe and the latest tick.
         
-        Args:
-            symbol: Symbol name
-            timeframes: List of timeframe strings
-            count: Number of candles per timeframe
-            
-        Returns:
-            Dict: {timeframe: dataframe, ...}
-        """
-        results = {}
-        for tf in timeframes:
-            results[tf] = self.get_candles(symbol, tf, count)
-        return results
-
-    def get_cached_data(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
-        """
-        Get cached data if available.
+        The requested count is not part of the key: one entry serves every count
+        it holds enough rows for.
         
         Args:
             symbol: Symbol name
             timeframe: Timeframe string
             
         Returns:
-            Optional[pd.DataFrame]: Cached data or None.
-        """
-        if symbol in self._data_cache and timeframe in self._data_cache[symbol]:
-            return self._data_cache[symbol][timeframe].data.copy()
-        return None
-
-    def clear_cache(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
-        """
-        Clear data cache with granular control.
-        
-        Args:
-            symbol: If specified, only clear data for this symbol.
-            timeframe: If specified, only clear this timeframe.
+            Optional[bytes]: 16-byte digest, or None if no tick is available.
         """
-        if symbol and timeframe:
-            if symbol in self._data_cache and timeframe in self._data_cache[symbol]:
-                del self._data_cache[symbol][timeframe]
-                self.logger.debug(f"Cleared cache for {symbol} {timeframe}")
-        elif symbol:
-            if symbol in self._data_cache:
-                del self._data_cache[symbol]
-                self.logger.debug(f"Cleared cache for {symbol}")
-        else:
-            self._data_cache.clear()
-            self.logger.debug("Cleared all data cache")
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is None:
+            return None
 
-    def invalidate_symbol_cache(self, symbol: str):
-        """Invalidate all timeframes for a symbol (e.g., on account change)."""
-        if symbol in self._data_cache:
-            del self._data_cache[symbol]
-            self.logger.info(f"Invalidated all cache for {symbol}")
+        h = hashlib.blake2b(digest_size=16)
+        h.update(symbol.encode())
+        h.update(timeframe.encode())
+        h.update(int(tick.time_msc).to_bytes(8, 'little'))
+        return h.digest()
 
-    def invalidate_all_cache(self):
-        """Invalidate all cached data (e.g., on account change or forced refresh)."""
-        self._data_cache.clear()
-        self.logger.info("Invalidated all cached data")
-
-    def get_current_tick(self, symbol: str) -> Optional[Dict]:
+    def _refresh_tail(self, symbol: str, timeframe: str, count: int, entry: CacheEntry) -> Optional[pd.DataFrame]:
         """
-        Get current tick information.
+        Extend a stale cache entry with only the candles added since it was cached.
+        
+        The number of bars to fetch is estimated from the time elapsed since the
+        entry was stored, plus overlap so the last cached (possibly still forming)
+        candle is replaced by its final values. The merged frame keeps the entry's
+        length, so a short request never shrinks a longer shared entry.
         
         Args:
             symbol: Symbol name
+            timeframe: Timeframe string
+            count: Number of candles requested (the entry must hold at least this many)
+            entry: Stale cache entry
             
         Returns:
-            Optional[Dict]: Tick information or None.
+            Optional[pd.DataFrame]: Merged data, or None if a full reload is needed.
         """
-        try:
-            tick = mt5.symbol_info_tick(symbol)
-            if tick is None:
-                self.logger.warning(f"Unable to get tick for {symbol}")
-                return None
-
-            return {
-                'bid': tick.bid,
-                'ask': tick.ask,
-                'last': tick.last,
-                'volume': tick.volume,
-                'time': datetime.fromtimestamp(tick.time),
-                'time_msc': tick.time_msc,
-                'volume_real': tick.volume_real,
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error retrieving tick for {symbol}: {e}")
+        cached_rows = len(entry.data)
+        if entry.last_candle_time is None or cached_rows < count:
             return None
 
-    def validate_data(self, df: pd.DataFrame) -> bool:
-        """
-        Validate OHLCV data integrity.
-        
-        Args:
-            df: DataFrame to validate
-            
-        Returns:
-            bool: True if data is valid.
-        """
-        try:
-            if df is None or len(df) == 0:
-                return False
+        tf, tf_minutes = _TF_INFO[timeframe]
+        elapsed_minutes = (datetime.now() - entry.timestamp).total_seconds() / 60
+        missing = int(elapsed_minutes // tf_minutes) + 2
+        if missing >= cached_rows:
+            return None
 
-            # Check for required columns
-            required = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in df.columns for col in required):
-                return False
+        rates = mt5.copy_rates_from_pos(symbol, tf, 0, missing)
+        if rates is None or len(rates) == 0:
+            return None
 
-            # Check for NaN values
-            if df[required].isnull().any().any():
-                self.logger.warning("Data contains NaN values")
-                return False
+        cached = entry.data
+        new_df = self._rates_to_df(rates, columns=cached.columns, price_dtype=self._price_dtype)
+        first_new = new_df['Timestamp'].iloc[0]
 
-            # Check OHLC relationships
-            invalid = (df['High'] < df['Low']).sum()
-            if invalid > 0:
-                self.logger.warning(f"{invalid} candles have High < Low")
-                return False
+        # No overlap with the cached tail means bars may be missing in between
+        if first_new > entry.last_candle_time:
+            return None
 
-            return True
+        merged = pd.concat([cached[cached['Timestamp'] < first_new], new_df], ignore_index=True)
+        self.logger.debug(f"Appended {len(new_df)} recent candles to cached {symbol} {timeframe}")
+        # Keep the entry's own length (at least count) so it neither shrinks nor grows
+        if len(merged) > cached_rows:
+            merged = merged.iloc[-cached_rows:].reset_index(drop=True)
+        return merged
 
-        except Exception as e:
-            self.logger.error(f"Error validating data: {e}")
-            return False
+    def _cache_path(self, symbol: str, timeframe: str) -> Path:
+        """Get the parquet file path for a symbol/timeframe."""
+        safe_symbol = symbol.replace('/', '-').replace('\\', '-')
+        return self._cache_dir / f"{safe_symbol}_{timeframe}.parquet"
 
-    def handle_missing_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _persist(self, symbol: str, timeframe: str, entry: CacheEntry):
         """
-        Handle missing data in OHLCV series.
+        Write a cache entry to disk, keeping its metadata in the parquet schema.
         
-        Args:
-            df: DataFrame with potential gaps
-            
-        Returns:
-            pd.DataFrame: DataFrame with gaps filled.
+        The file is written under a temporary name and renamed into place, so a
+        crash or a concurrent writer (several managers share the directory)
+        never leaves a truncated file for _load_persisted_cache to pick up.
         """
+        tmp_path = None
         try:
-            if df is None or len(df) == 0:
-                return df
-
-            # Forward fill for missing values
-            df['Open'] = df['Open'].fillna(method='ffill')
-            df['Close'] = df['Close'].fillna(method='ffill')
-            df['High'] = df['High'].fillna(method='ffill')
-            df['Low'] = df['Low'].fillna(method='ffill')
-            df['Volume'] = df['Volume'].fillna(0)
-
-            # Backward fill for any remaining NaN
-            df = df.fillna(method='bfill')
-
-            return df
-
+            table = pa.Table.from_pandas(entry.data, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata.update({
+                b'symbol': symbol.encode(),
+                b'timeframe': timeframe.encode(),
+                b'cached_at': entry.timestamp.isoformat().encode(),
+                b'last_candle_time': str(entry.last_candle_time).encode(),
+                b'rows': str(len(entry.data)).encode(),
+            })
+            table = table.replace_schema_metadata(metadata)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            os.close(fd)
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, self._cache_path(symbol, timeframe))
+            tmp_path = None
         except Exception as e:
-            self.logger.error(f"Error handling missing data: {e}")
-            return df
+            self.logger.warning(f"Failed to persist cache for {symbol} {timeframe}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
+    def _load_persisted_cache(self):
+        """
+        Rehydrate the in-memory cache from parquet files in the cache directory.
+        
+        Files are checked from their schema metadata before the data is read:
+        a set whose latest candle is too old to be topped up by _refresh_tail
+        would only force a full reload, so it is skipped.
+        """
+        loaded = 0
+        now = np.datetime64(datetime.now(), 's')
+        for path in self._cache_dir.glob('*.parquet'):
+            try:
+                metadata = pq.read_schema(path).metadata or {}
+                symbol = metadata[b'symbol'].decode()
+                timeframe = metadata[b'timeframe'].decode()
+                if timeframe not in _TF_INFO:
+                    continue
+
+                rows = int(metadata[b'rows'])
+                last_candle_time = np.datetime64(metadata[b'last_candle_time'].decode(), 's')
+                missing = (now - last_candle_time) // np.timedelta64(_TF_INFO[timeframe][1], 'm')
+                if missing + 2 >= rows:
+                    self.logger.debug(f"Skipping outdated cache file {path.name}")
+                    continue
+
+                table = pq.read_table(path)
+                if table.num_rows != rows:
+                    self.logger.warning(f"Skipping inconsistent cache file {path.name}")
+                    continue
+
+                cached_at = datetime.fromisoformat(metadata[b'cached_at'].decode())
+                # Parquet has no second resolution; restore what _rates_to_df produces
+                data = table.to_pandas().astype({'Timestamp': 'datetime64[s]'})
+                entry = CacheEntry(data, timeframe, timestamp=cached_at)
+                self._store(symbol, timeframe, entry)
+                loaded += 1
+            except Exception as e:
+                self.logger.warning(f"Skipping unreadable cache file {path.name}: {e}")
+
+        if loaded:
+            self.logger.info(f"Loaded {loaded} cached candle sets from {self._cache_dir}")
+
+    def _remove_persisted(self, symbol: Optional[str] = None):
+        """Delete persisted cache files for a symbol, or all of them."""
+        if self._cache_dir is None:
+            return
+
+        for path in self._cache_dir.glob('*.parquet'):
+            try:
+                if symbol is not None:
+                    metadata = pq.read_schema(path).metadata or {}
+                    if metadata.get(b'symbol', b'').decode() != symbol:
+                        continue
+                path.unlink()
+            except Exception as e:
+                self.logger.warning(f"Failed to remove cache file {path.name}: {e}")
 
-    def get_candles(self, symbol: str, timeframe: str, count: int = 500) -> Optional[pd.DataFrame]:
+    def subscribe(self, symbol: str, timeframe: str, count: int = 500):
         """
-        Retrieve candle data from MT5.
+        Keep a symbol/timeframe warm in the cache from a background thread.
+        
+        Each pass re-keys the entry against the latest tick, as get_candles does,
+        so calls made before the next tick are served from cache. Passes run four
+        times per timeframe period; on an active symbol ticks arrive far more
+        often, so a foreground call usually still sees a changed key. Warming
+        then only keeps that call's tail refresh down to a bar or two.
         
         Args:
             symbol: Symbol name
-            timeframe: Timeframe string (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
-            count: Number of candles to retrieve
-            
-        Returns:
-            Optional[pd.DataFrame]: OHLCV data or None if error.
-        """
-        try:
-            if timeframe not in self.TIMEFRAME_MAP:
-                self.logger.error(f"Invalid timeframe: {timeframe}")
-                return None
-
-            tf = self.TIMEFRAME_MAP[timeframe]
-
-            # Get candle data
-            rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
-            if rates is None or len(rates) == 0:
-                self.logger.warning(f"No data retrieved for {symbol} {timeframe}")
-                return None
-
-            # Convert to DataFrame
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            df = df.rename(columns={
-                'time': 'Timestamp',
-                'open': 'Open',
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'tick_volume': 'Volume',
-                'real_volume': 'RealVolume',
-                'spread': 'Spread',
-            })
-
-            df = df[['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume', 'RealVolume', 'Spread']]
-            df = df.sort_values('Timestamp').reset_index(drop=True)
-
-            # Cache the data
-            if symbol not in self._data_cache:
-                self._data_cache[symbol] = {}
-            self._data_cache[symbol][timeframe] = df
-
-            self.logger.debug(f"Retrieved {len(df)} candles for {symbol} {timeframe}")
-            return df
-
-        except Exception as e:
-            self.logger.error(f"Error retrieving candles for {symbol} {timeframe}: {e}")
-            return None
+            timeframe: Timeframe string
+            count: Number of candles to keep cached
+        """
+        if timeframe not in _TF_INFO:
+            self.logger.error(f"Invalid timeframe: {timeframe}")
+            return
+
+        with self._subscriptions_lock:
+            self._subscriptions[(symbol, timeframe)] = count
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher_stop.clear()
+                self._refresher = Thread(
+                    target=self._refresh_loop,
+                    daemon=True,
+                    name="MarketDataRefresher"
+                )
+                self._refresher.start()
+        self.logger.info(f"Subscribed {symbol} {timeframe} for background refresh")
+
+    def unsubscribe(self, symbol: str, timeframe: str):
+        """Stop background refreshing of a symbol/timeframe."""
+        with self._subscriptions_lock:
+            self._subscriptions.pop((symbol, timeframe), None)
+
+    def stop_refresher(self):
+        """Stop the background refresh thread, if running."""
+        self._refresher_stop.set()
+        if self._refresher:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def _refresh_loop(self):
+        """Background loop that refreshes subscribed entries before they go stale."""
+        while not self._refresher_stop.is_set():
+            with self._subscriptions_lock:
+                subscriptions = dict(self._subscriptions)
+
+            for (symbol, timeframe), count in subscriptions.items():
+                if self._refresher_stop.is_set():
+                    break
+                try:
+                    self._warm(symbol, timeframe, count)
+                except Exception as e:
+                    self.logger.error(f"Background refresh failed for {symbol} {timeframe}: {e}")
+
+            # Wake four times per period of the shortest subscribed timeframe
+            min_minutes = min((_TF_INFO[tf][1] for _, tf in subscriptions), default=1)
+            self._refresher_stop.wait(min_minutes * 60 / 4)
+
+    def _warm(self, symbol: str, timeframe: str, count: int):
+        """
+        Refresh a cache entry whose tick state key no longer matches.
+        
+        Without a tick the wall-clock rule decides instead: refresh once the
+        entry is within 90% of its staleness threshold.
+        """
+        tf, tf_minutes = _TF_INFO[timeframe]
+        state_key = self._cache_key(symbol, timeframe)
+        entry = self._lookup(symbol, timeframe)
+        if entry is not None and len(entry.data) >= count and (
+            entry.state_key == state_key if state_key is not None
+            else not entry.is_stale(datetime.now(), tf_minutes * 0.9)
+        ):
+            return
+
+        # Passing the entry lets a near-stale cache be topped up with only new bars;
+        # going through the in-flight map lets a concurrent get_candles share the fetch
+        if entry is not None and len(entry.data) < count:
+            entry = None
+        self._fetch_shared(symbol, timeframe, tf, count, entry, state_key)
 
     def get_candles_from_date(self, symbol: str, timeframe: str, start_date: datetime) -> Optional[pd.DataFrame]:
         """
@@ -412,11 +642,11 @@ class MarketDataManager:
             Optional[pd.DataFrame]: OHLCV data or None if error.
         """
         try:
-            if timeframe not in self.TIMEFRAME_MAP:
+            info = _TF_INFO.get(timeframe)
+            if info is None:
                 self.logger.error(f"Invalid timeframe: {timeframe}")
                 return None
-
-            tf = self.TIMEFRAME_MAP[timeframe]
+            tf = info[0]
 
             # Get candle data from date
             rates = mt5.copy_rates_from(symbol, tf, start_date, 500)
@@ -425,21 +655,7 @@ class MarketDataManager:
                 return None
 
             # Convert to DataFrame
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            df = df.rename(columns={
-                'time': 'Timestamp',
-                'open': 'Open',
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'tick_volume': 'Volume',
-                'real_volume': 'RealVolume',
-                'spread': 'Spread',
-            })
-
-            df = df[['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume', 'RealVolume', 'Spread']]
-            df = df.sort_values('Timestamp').reset_index(drop=True)
+            df = self._rates_to_df(rates, price_dtype=self._price_dtype)
 
             self.logger.debug(f"Retrieved {len(df)} candles for {symbol} from {start_date}")
             return df
@@ -448,6 +664,65 @@ class MarketDataManager:
             self.logger.error(f"Error retrieving candles for {symbol} from {start_date}: {e}")
             return None
 
+    def get_multiple_timeframes(
+        self,
+        symbol: str,
+        timeframes: List[str],
+        count: int = 500
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Retrieve candles for multiple timeframes simultaneously.
+        
+        Args:
+            symbol: Symbol name
+            timeframes: List of timeframe strings
+            count: Number of candles per timeframe
+            
+        Returns:
+            Dict: {timeframe: dataframe, ...}
+        """
+        results = {}
+        for tf in timeframes:
+            results[tf] = self.get_candles(symbol, tf, count)
+        return results
+
+    def _lookup(self, symbol: str, timeframe: str) -> Optional[CacheEntry]:
+        """Get a cache entry and mark it as most recently used."""
+        key = (symbol, timeframe)
+        with self._cache_lock:
+            entry = self._data_cache.get(key)
+            if entry is not None:
+                self._data_cache.move_to_end(key)
+            return entry
+
+    def _store(self, symbol: str, timeframe: str, entry: CacheEntry):
+        """Insert a cache entry, evicting the least recently used beyond the limit."""
+        key = (symbol, timeframe)
+        with self._cache_lock:
+            self._data_cache[key] = entry
+            self._data_cache.move_to_end(key)
+            while len(self._data_cache) > self._max_cache_entries:
+                self._data_cache.popitem(last=False)
+
+    def _drop_symbol(self, symbol: str) -> bool:
+        """Remove all timeframes cached for a symbol. Returns True if any were cached."""
+        with self._cache_lock:
+            keys = [key for key in self._data_cache if key[0] == symbol]
+            for key in keys:
+                del self._data_cache[key]
+        return bool(keys)
+
+    def update_cache(self, symbol: str, timeframe: str, data: pd.DataFrame):
+        """
+        Replace the cached data for a symbol/timeframe.
+        
+        Args:
+            symbol: Symbol name
+            timeframe: Timeframe string
+            data: OHLCV data to cache (e.g. history merged with recent candles)
+        """
+        self._store(symbol, timeframe, CacheEntry(data, timeframe))
+
     def get_cached_data(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
         """
         Get cached data if available.
@@ -459,25 +734,47 @@ class MarketDataManager:
         Returns:
             Optional[pd.DataFrame]: Cached data or None.
         """
-        if symbol in self._data_cache and timeframe in self._data_cache[symbol]:
-            return self._data_cache[symbol][timeframe].copy()
+        entry = self._lookup(symbol, timeframe)
+        if entry is not None:
+            return entry.data.copy(deep=False)
         return None
 
-    def clear_cache(self, symbol: Optional[str] = None):
+    def clear_cache(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
         """
-        Clear data cache.
+        Clear data cache with granular control.
         
         Args:
             symbol: If specified, only clear data for this symbol.
+            timeframe: If specified, only clear this timeframe.
         """
-        if symbol:
-            if symbol in self._data_cache:
-                del self._data_cache[symbol]
+        if symbol and timeframe:
+            with self._cache_lock:
+                removed = self._data_cache.pop((symbol, timeframe), None)
+            if removed is not None:
+                self.logger.debug(f"Cleared cache for {symbol} {timeframe}")
+        elif symbol:
+            if self._drop_symbol(symbol):
                 self.logger.debug(f"Cleared cache for {symbol}")
         else:
-            self._data_cache.clear()
+            with self._cache_lock:
+                self._data_cache.clear()
             self.logger.debug("Cleared all data cache")
 
+    def invalidate_symbol_cache(self, symbol: str):
+        """Invalidate all timeframes for a symbol (e.g., on account change)."""
+        self._digits_cache.pop(symbol, None)
+        self._remove_persisted(symbol)
+        if self._drop_symbol(symbol):
+            self.logger.info(f"Invalidated all cache for {symbol}")
+
+    def invalidate_all_cache(self):
+        """Invalidate all cached data (e.g., on account change or forced refresh)."""
+        with self._cache_lock:
+            self._data_cache.clear()
+        self._digits_cache.clear()
+        self._remove_persisted()
+        self.logger.info("Invalidated all cached data")
+
     def get_current_tick(self, symbol: str) -> Optional[Dict]:
         """
         Get current tick information.
@@ -518,32 +815,28 @@ class MarketDataManager:
         Returns:
             bool: True if data is valid.
         """
-        try:
-            if df is None or len(df) == 0:
-                return False
-
-            # Check for required columns
-            required = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in df.columns for col in required):
-                return False
-
-            # Check for NaN values
-            if df[required].isnull().any().any():
-                self.logger.warning("Data contains NaN values")
-                return False
+        if df is None or len(df) == 0:
+            return False
 
-            # Check OHLC relationships
-            invalid = (df['High'] < df['Low']).sum()
-            if invalid > 0:
-                self.logger.warning(f"{invalid} candles have High < Low")
-                return False
+        # Check for required columns
+        if not self.REQUIRED_SET.issubset(df.columns):
+            return False
 
-            return True
+        # Check for NaN values in a single pass over the raw array
+        if np.isnan(df[list(self.REQUIRED)].to_numpy(dtype=np.float64)).any():
+            self.logger.warning("Data contains NaN values")
+            return False
 
-        except Exception as e:
-            self.logger.error(f"Error validating data: {e}")
+        # Check OHLC relationships; only count violations when reporting them
+        high = df['High'].to_numpy(copy=False)
+        low = df['Low'].to_numpy(copy=False)
+        if np.less(high, low).any():
+            invalid = int(np.count_nonzero(high < low))
+            self.logger.warning(f"{invalid} candles have High < Low")
             return False
 
+        return True
+
     def handle_missing_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Handle missing data in OHLCV series.
@@ -555,18 +848,19 @@ class MarketDataManager:
             pd.DataFrame: DataFrame with gaps filled.
         """
         try:
-            if df is None or len(df) == 0:
+            if df is None or df.empty:
                 return df
 
-            # Forward fill for missing values
-            df['Open'] = df['Open'].fillna(method='ffill')
-            df['Close'] = df['Close'].fillna(method='ffill')
-            df['High'] = df['High'].fillna(method='ffill')
-            df['Low'] = df['Low'].fillna(method='ffill')
-            df['Volume'] = df['Volume'].fillna(0)
+            # Forward fill all price columns in one pass (assign returns a new
+            # frame, so cached data handed out by get_cached_data is never mutated)
+            prices = df[self.PRICE_COLUMNS].ffill()
+            df = df.assign(
+                **{col: prices[col] for col in self.PRICE_COLUMNS},
+                Volume=df['Volume'].fillna(0),
+            )
 
             # Backward fill for any remaining NaN
-            df = df.fillna(method='bfill')
+            df = df.bfill()
 
             return df
 
@@ -577,9 +871,10 @@ class MarketDataManager:
     def is_timeframe_available(self, symbol: str, timeframe: str) -> bool:
         """Check if a timeframe is available for a symbol."""
         try:
-            if timeframe not in self.TIMEFRAME_MAP:
+            info = _TF_INFO.get(timeframe)
+            if info is None:
                 return False
-            tf = self.TIMEFRAME_MAP[timeframe]
+            tf = info[0]
             rates = mt5.copy_rates_from_pos(symbol, tf, 0, 1)
             return rates is not None and len(rates) > 0
         except Exception as e:
@@ -590,7 +885,14 @@ class MarketDataManager:
         """Get list of available timeframes for a symbol."""
         if timeframe_list is None:
             timeframe_list = list(self.TIMEFRAME_MAP.keys())
-        available = [tf for tf in timeframe_list if self.is_timeframe_available(symbol, tf)]
+
+        # Each probe is an MT5 round-trip, so run them concurrently
+        if PERFORMANCE_CONFIG['parallel_timeframe_fetch'] and len(timeframe_list) > 1:
+            with ThreadPoolExecutor(max_workers=len(timeframe_list)) as executor:
+                flags = list(executor.map(lambda tf: self.is_timeframe_available(symbol, tf), timeframe_list))
+            available = [tf for tf, ok in zip(timeframe_list, flags) if ok]
+        else:
+            available = [tf for tf in timeframe_list if self.is_timeframe_available(symbol, tf)]
         if available:
             self.logger.info(f"Available timeframes for {symbol}: {available}")
         return available
@@ -616,15 +918,51 @@ class MarketDataManager:
         if len(df) < min_candles:
             return False, f"Insufficient data: {len(df)} candles, need {min_candles} minimum"
         
-        # Check for recent data (not stale)
-        latest_time = df['Timestamp'].iloc[-1]
-        age = datetime.now() - latest_time
-        from datetime import timedelta
-        if age > timedelta(hours=24):
-            return False, f"Data is stale: latest candle is {age.days} days old"
+        # Check for recent data (not stale), in numpy to avoid boxing a pd.Timestamp
+        latest_time = df['Timestamp'].to_numpy(copy=False)[-1]
+        age_seconds = int((np.datetime64(datetime.now()) - latest_time) // np.timedelta64(1, 's'))
+        if age_seconds > self.STALE_DATA_SECONDS:
+            return False, f"Data is stale: latest candle is {age_seconds // 86400} days old"
         
         return True, f"Data OK: {len(df)} candles"
     
+    def prepare(self, df: pd.DataFrame, min_candles: int = 20) -> tuple:
+        """
+        Check sufficiency, fill gaps and validate data in a single pass.
+        
+        Combines check_data_sufficiency, handle_missing_data and validate_data:
+        the OHLCV block is read into one array that serves both the NaN and the
+        High < Low checks, and gaps are only filled when NaNs are present.
+        
+        Args:
+            df: DataFrame to prepare
+            min_candles: Minimum required candles
+            
+        Returns:
+            tuple: (prepared DataFrame, is_ok, message)
+        """
+        is_sufficient, message = self.check_data_sufficiency(df, min_candles)
+        if not is_sufficient:
+            return df, False, message
+
+        if not self.REQUIRED_SET.issubset(df.columns):
+            return df, False, "Data is missing required OHLCV columns"
+
+        columns = list(self.REQUIRED)
+        block = df[columns].to_numpy(dtype=np.float64)
+        if np.isnan(block).any():
+            df = self.handle_missing_data(df)
+            block = df[columns].to_numpy(dtype=np.float64)
+            if np.isnan(block).any():
+                return df, False, "Data contains NaN values that could not be filled"
+
+        # REQUIRED is (Open, High, Low, Close, Volume)
+        invalid = int(np.count_nonzero(block[:, 1] < block[:, 2]))
+        if invalid:
+            return df, False, f"{invalid} candles have High < Low"
+
+        return df, True, message
+    
     def normalize_symbol_precision(self, symbol: str, price: float) -> float:
         """
         Normalize price to symbol's decimal precision (cross-broker compatibility).
@@ -638,15 +976,27 @@ class MarketDataManager:
             float: Normalized price
         """
         try:
-            symbol_info = mt5.symbol_info(symbol)
-            if symbol_info is None:
-                self.logger.debug(f"Cannot normalize {symbol} - using default precision")
-                return round(price, 5)  # Default to 5 decimals
+            # Digits never change for a symbol, so only ask MT5 once
+            precision = self._digits_cache.get(symbol)
+            if precision is None:
+                symbol_info = mt5.symbol_info(symbol)
+                if symbol_info is None:
+                    self.logger.debug(f"Cannot normalize {symbol} - using default precision")
+                    return round(price, 5)  # Default to 5 decimals
+                
+                # Use symbol's digits property for precision
+                precision = symbol_info.digits
+                self._digits_cache[symbol] = precision
             
-            # Use symbol's digits property for precision
-            precision = symbol_info.digits
             return round(price, precision)
         
         except Exception as e:
             self.logger.debug(f"Error normalizing {symbol} precision: {e}")
             return round(price, 5)
+
+
+# (MT5 timeframe constant, minutes) per timeframe string, resolved once at import
+_TF_INFO: Dict[str, Tuple[int, int]] = {
+    timeframe: (tf, MarketDataManager.TIMEFRAME_MINUTES[timeframe])
+    for timeframe, tf in MarketDataManager.TIMEFRAME_MAP.items()
+}
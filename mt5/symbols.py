@@ -1,196 +1,350 @@
 """Symbol discovery and categorization."""
 
+import re
+import threading
+import time
 import MetaTrader5 as mt5
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, Optional, Set, Callable, Any
 from core.logger import get_logger
+from config.settings import SYMBOL_CONFIG
 from datetime import datetime
+from sys import intern
 
 
 class SymbolManager:
     """Manages symbol discovery and categorization with dynamic refresh support."""
 
+    # Category names in the order they are reported, interned so every cache
+    # keyed or valued by category shares the same string objects
+    CATEGORIES = tuple(map(intern, (
+        'Forex Majors', 'Forex Minors', 'Forex Exotics', 'Volatility Indices',
+        'Boom and Crash', 'Jump Indices', 'Step Indices', 'Indices',
+        'Commodities', 'Metals', 'Crypto', 'Other',
+    )))
+
     # Symbol name patterns for categorization
-    FOREX_MAJORS = {'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'AUDUSD', 'USDCAD', 'NZDUSD'}
-    FOREX_MINORS = {'EURJPY', 'EURGBP', 'EURCHF', 'EURCAD', 'EURAUD', 'EURNZD',
-                    'GBPJPY', 'GBPCHF', 'GBPCAD', 'GBPAUD', 'GBPNZD',
-                    'CHFJPY', 'CADCHF', 'AUDCHF', 'NZDCHF',
-                    'CADJPY', 'AUDJPY', 'NZDJPY',
-                    'AUDCAD', 'AUDNZD', 'CADNZD'}
-    VOLATILITY_INDICES = {'VOLATILITY10', 'VOLATILITY25', 'VOLATILITY50', 'VOLATILITY75', 'VOLATILITY100',
-                         'VOLATILITY10S', 'VOLATILITY25S', 'VOLATILITY50S', 'VOLATILITY75S', 'VOLATILITY100S'}
-    BOOM_CRASH = {'BOOM1000', 'BOOM500', 'BOOM300', 'CRASH1000', 'CRASH500', 'CRASH300',
-                 'BOOM100', 'CRASH100', 'BOOM50', 'CRASH50'}
-    JUMP_INDICES = {'JUMP10', 'JUMP25', 'JUMP50', 'JUMP75', 'JUMP100',
-                   'JUMP10S', 'JUMP25S', 'JUMP50S', 'JUMP75S', 'JUMP100S'}
-    STEP_INDICES = {'STEP10', 'STEP25', 'STEP50', 'STEP75', 'STEP100',
-                   'STEP10S', 'STEP25S', 'STEP50S', 'STEP75S', 'STEP100S'}
+    FOREX_MAJORS = frozenset({'EURUSD', 'GBPUSD', 'USDJPY', 'USDCHF', 'AUDUSD', 'USDCAD', 'NZDUSD'})
+    FOREX_MINORS = frozenset({'EURJPY', 'EURGBP', 'EURCHF', 'EURCAD', 'EURAUD', 'EURNZD',
+                              'GBPJPY', 'GBPCHF', 'GBPCAD', 'GBPAUD', 'GBPNZD',
+                              'CHFJPY', 'CADCHF', 'AUDCHF', 'NZDCHF',
+                              'CADJPY', 'AUDJPY', 'NZDJPY',
+                              'AUDCAD', 'AUDNZD', 'CADNZD'})
+    VOLATILITY_INDICES = frozenset({'VOLATILITY10', 'VOLATILITY25', 'VOLATILITY50', 'VOLATILITY75', 'VOLATILITY100',
+                                   'VOLATILITY10S', 'VOLATILITY25S', 'VOLATILITY50S', 'VOLATILITY75S', 'VOLATILITY100S'})
+    BOOM_CRASH = frozenset({'BOOM1000', 'BOOM500', 'BOOM300', 'CRASH1000', 'CRASH500', 'CRASH300',
+                           'BOOM100', 'CRASH100', 'BOOM50', 'CRASH50'})
+    JUMP_INDICES = frozenset({'JUMP10', 'JUMP25', 'JUMP50', 'JUMP75', 'JUMP100',
+                             'JUMP10S', 'JUMP25S', 'JUMP50S', 'JUMP75S', 'JUMP100S'})
+    STEP_INDICES = frozenset({'STEP10', 'STEP25', 'STEP50', 'STEP75', 'STEP100',
+                             'STEP10S', 'STEP25S', 'STEP50S', 'STEP75S', 'STEP100S'})
+
+    # Exact-name lookup built once from the sets above (they are disjoint)
+    _CATEGORY_MAP = {
+        **dict.fromkeys(FOREX_MAJORS, 'Forex Majors'),
+        **dict.fromkeys(FOREX_MINORS, 'Forex Minors'),
+        **dict.fromkeys(VOLATILITY_INDICES, 'Volatility Indices'),
+        **dict.fromkeys(BOOM_CRASH, 'Boom and Crash'),
+        **dict.fromkeys(JUMP_INDICES, 'Jump Indices'),
+        **dict.fromkeys(STEP_INDICES, 'Step Indices'),
+    }
+
+    # Substring patterns for the heuristic categories, compiled once
+    _EXOTIC_RE = re.compile('ZAR|TRY|MXN|BRL|CNY|INR|RUB|SGD|HKD|NOK|SEK|DKK')
+    _MAJOR_QUOTE_RE = re.compile('USD|EUR|GBP')
+    _CRYPTO_RE = re.compile('BTC|ETH|LTC|XRP|BCH|ADA|DOT|LINK|DOGE|USDT')
+    _INDEX_RE = re.compile('SPX|NDX|DAX|CAC|FTSE|NIKKEI|ASX|SENSEX|HANG|INDEX')
+    # One scan telling whether any substring-based check can match at all
+    _SUBSTRING_RE = re.compile('|'.join(p.pattern for p in (_EXOTIC_RE, _CRYPTO_RE, _INDEX_RE)))
+
+    _METALS = frozenset({'XAUUSD', 'XAGUSD', 'XPTUSD', 'XPDUSD', 'GOLD', 'SILVER', 'PLATINUM', 'PALLADIUM'})
+    _METAL_PREFIXES = ('XAU', 'XAG', 'XPT', 'XPD')
+    _COMMODITIES = frozenset({'WTIUSD', 'BRENTUSD', 'NATGAS', 'CORN', 'WHEAT', 'SOYBEANS', 'SUGAR', 'COFFEE'})
+    _COMMODITY_PREFIXES = ('WTI', 'BRENT', 'NGAS', 'CL', 'GC', 'SI', 'CU', 'NG')
+
+    # Metals and commodities only match names starting with one of these
+    _METAL_FIRST_CHARS = frozenset(s[0] for s in (*_METALS, *_METAL_PREFIXES))
+    _COMMODITY_FIRST_CHARS = frozenset(s[0] for s in (*_COMMODITIES, *_COMMODITY_PREFIXES))
+
+    # symbol_info fields returned by get_symbol_info, read in one attrgetter call
+    INFO_FIELDS = ('name', 'description', 'bid', 'ask', 'digits', 'spread', 'spread_float',
+                   'volume', 'volume_high', 'volume_low', 'time', 'trade_mode', 'trade_execution',
+                   'session_deals', 'session_buy_orders', 'session_sell_orders',
+                   'volume_real', 'volume_high_real', 'volume_low_real')
+    _get_info_fields = staticmethod(attrgetter(*INFO_FIELDS))
+
+    # symbol_info fields that do not change tick to tick
+    STATIC_INFO_FIELDS = ('name', 'description', 'digits', 'trade_mode')
 
     def __init__(self):
         """Initialize symbol manager."""
         self.logger = get_logger()
-        self._symbol_cache = {}
+        self._symbol_cache: Set[str] = set()
         self._categories_cache = {}
+        self._sym_to_cat: Dict[str, str] = {}
         self._last_refresh = None
+        # (monotonic fetch time, names) of the last successful symbols_get
+        self._symbols_fetched: Optional[tuple[float, list[str]]] = None
+        self._symbols_reuse = SYMBOL_CONFIG.get('symbols_reuse_seconds', 0.1)
         self._on_symbols_refreshed: list[Callable] = []
         self._on_new_symbols: list[Callable[[list[str]], None]] = []
         self._on_removed_symbols: list[Callable[[list[str]], None]] = []
+        self._cb_pool = ThreadPoolExecutor(
+            max_workers=SYMBOL_CONFIG.get('callback_workers', 4),
+            thread_name_prefix='sym-cb'
+        )
+        self._callback_timeout = SYMBOL_CONFIG.get('callback_timeout_seconds', 5)
+        # Indexed by whether _SUBSTRING_RE matched the symbol
+        self._probe_tables = (self._build_probe_table(False), self._build_probe_table(True))
+
+        # symbol -> (monotonic fetch time, info dict), least recently used first
+        self._info_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._static_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._info_cache_lock = threading.Lock()
+        self._info_ttl = SYMBOL_CONFIG.get('info_cache_ttl_seconds', 0.5)
+        self._max_info_entries = SYMBOL_CONFIG.get('info_cache_max_entries', 256)
+
+    def _build_probe_table(self, substring_hit: bool) -> tuple[dict[str, tuple], tuple]:
+        """
+        Build the first-character dispatch table for the heuristic checks.
+        
+        Args:
+            substring_hit: Whether the substring-based checks can match; when
+                False they are left out and only the prefix checks remain
+            
+        Returns:
+            tuple: (probes keyed by first character, probes for any other character).
+            Each probe is a (category, predicate) pair, in classification order.
+        """
+        probes = (
+            ('Forex Exotics', self._is_forex_exotic, None),
+            ('Metals', self._is_metal, self._METAL_FIRST_CHARS),
+            ('Crypto', self._is_crypto, None),
+            ('Commodities', self._is_commodity, self._COMMODITY_FIRST_CHARS),
+            ('Indices', self._is_index, None),
+        )
+        if not substring_hit:
+            probes = tuple(p for p in probes if p[2] is not None)
+        default = tuple((intern(cat), probe) for cat, probe, first in probes if first is None)
+        table = {
+            ch: tuple((intern(cat), probe) for cat, probe, first in probes if first is None or ch in first)
+            for ch in self._METAL_FIRST_CHARS | self._COMMODITY_FIRST_CHARS
+        }
+        return table, default
 
     def get_all_symbols(self) -> Optional[list[str]]:
         """
         Retrieve all available symbols from MT5.
         
+        Calls made within ``symbols_reuse_seconds`` of a successful fetch
+        reuse its result instead of querying MT5 again.
+        
         Returns:
             Optional[list[str]]: List of symbols or None if error.
         """
+        fetched = self._symbols_fetched
+        if fetched is not None and time.monotonic() - fetched[0] < self._symbols_reuse:
+            return list(fetched[1])
+
         try:
             symbols = mt5.symbols_get()
             if symbols is None or len(symbols) == 0:
                 self.logger.warning("No symbols available from MT5")
                 return []
 
-            symbol_names = [s.name for s in symbols]
+            # Interned so repeated fetches share one object per name across caches
+            symbol_names = [intern(s.name) for s in symbols]
             self.logger.info(f"Retrieved {len(symbol_names)} symbols from MT5")
-            return symbol_names
+            self._symbols_fetched = (time.monotonic(), symbol_names)
+            return list(symbol_names)
 
         except Exception as e:
             self.logger.error(f"Error retrieving symbols: {e}")
             return None
 
-    def categorize_symbols(self) -> Optional[dict[str, list[str]]]:
+    def categorize_symbols(self, symbols: Optional[list[str]] = None) -> Optional[dict[str, list[str]]]:
         """
         Categorize all symbols by type.
         
+        Args:
+            symbols: Symbol names to categorize; fetched from MT5 when omitted
+            
         Returns:
             Optional[dict[str, list[str]]]: Symbols grouped by category.
         """
         try:
-            symbols = self.get_all_symbols()
+            if symbols is None:
+                symbols = self.get_all_symbols()
             if symbols is None:
                 return None
 
-            categories = {
-                'Forex Majors': [],
-                'Forex Minors': [],
-                'Forex Exotics': [],
-                'Volatility Indices': [],
-                'Boom and Crash': [],
-                'Jump Indices': [],
-                'Step Indices': [],
-                'Indices': [],
-                'Commodities': [],
-                'Metals': [],
-                'Crypto': [],
-                'Other': [],
-            }
+            # Lists are only created for categories that receive a symbol
+            categories = defaultdict(list)
+
+            classify = self._classify_one
+            sym_to_cat = {}
 
             for symbol in symbols:
-                upper_symbol = symbol.upper()
-
-                if upper_symbol in self.FOREX_MAJORS:
-                    categories['Forex Majors'].append(symbol)
-                elif upper_symbol in self.FOREX_MINORS:
-                    categories['Forex Minors'].append(symbol)
-                elif upper_symbol in self.VOLATILITY_INDICES:
-                    categories['Volatility Indices'].append(symbol)
-                elif upper_symbol in self.BOOM_CRASH:
-                    categories['Boom and Crash'].append(symbol)
-                elif upper_symbol in self.JUMP_INDICES:
-                    categories['Jump Indices'].append(symbol)
-                elif upper_symbol in self.STEP_INDICES:
-                    categories['Step Indices'].append(symbol)
-                elif self._is_forex_exotic(upper_symbol):
-                    categories['Forex Exotics'].append(symbol)
-                elif self._is_metal(upper_symbol):
-                    categories['Metals'].append(symbol)
-                elif self._is_crypto(upper_symbol):
-                    categories['Crypto'].append(symbol)
-                elif self._is_commodity(upper_symbol):
-                    categories['Commodities'].append(symbol)
-                elif self._is_index(upper_symbol):
-                    categories['Indices'].append(symbol)
-                else:
-                    categories['Other'].append(symbol)
-
-            # Remove empty categories
-            categories = {k: v for k, v in categories.items() if v}
+                category = classify(symbol.upper())
+                sym_to_cat[symbol] = category
+                categories[category].append(symbol)
+
+            # Report in canonical category order
+            categories = {name: categories[name] for name in self.CATEGORIES if name in categories}
 
             self.logger.info(f"Categorized {len(symbols)} symbols into {len(categories)} categories")
             self._categories_cache = categories
+            self._sym_to_cat = sym_to_cat
             return categories
 
         except Exception as e:
             self.logger.error(f"Error categorizing symbols: {e}")
             return None
 
+    def _classify_one(self, upper_symbol: str) -> str:
+        """
+        Get the category of a single symbol.
+        
+        Args:
+            upper_symbol: Upper-cased symbol name
+            
+        Returns:
+            str: Category name, 'Other' when nothing matches.
+        """
+        category = self._CATEGORY_MAP.get(upper_symbol)
+        if category is not None:
+            return category
+        table, default = self._probe_tables[self._SUBSTRING_RE.search(upper_symbol) is not None]
+        for name, probe in table.get(upper_symbol[:1], default):
+            if probe(upper_symbol):
+                return name
+        return 'Other'
+
+    def _apply_category_delta(self, added: Set[str], removed: Set[str]) -> None:
+        """
+        Update the cached categories for added/removed symbols only.
+        
+        Touched category lists are rebuilt rather than mutated, so lists
+        already handed out by get_category_symbols stay unchanged.
+        
+        Args:
+            added: Symbols to classify and add
+            removed: Symbols to drop
+        """
+        categories = dict(self._categories_cache)
+        sym_to_cat = self._sym_to_cat
+
+        if removed:
+            touched = {sym_to_cat.pop(s) for s in removed if s in sym_to_cat}
+            for category in touched:
+                categories[category] = [s for s in categories[category] if s not in removed]
+
+        new_by_category: dict[str, list[str]] = {}
+        for symbol in added:
+            category = self._classify_one(symbol.upper())
+            sym_to_cat[symbol] = category
+            new_by_category.setdefault(category, []).append(symbol)
+        for category, symbols in new_by_category.items():
+            categories[category] = categories.get(category, []) + symbols
+
+        # Keep the canonical category order and drop emptied categories
+        self._categories_cache = {
+            name: categories[name] for name in self.CATEGORIES if categories.get(name)
+        }
+
     def _is_forex_exotic(self, symbol: str) -> bool:
         """Check if symbol is forex exotic pair."""
-        forex_patterns = ['ZAR', 'TRY', 'MXN', 'BRL', 'CNY', 'INR', 'RUB', 'SGD', 'HKD', 'NOK', 'SEK', 'DKK']
-        return any(pattern in symbol for pattern in forex_patterns) and any(
-            c in symbol for c in ['USD', 'EUR', 'GBP']
+        return (
+            self._EXOTIC_RE.search(symbol) is not None
+            and self._MAJOR_QUOTE_RE.search(symbol) is not None
         )
 
     def _is_metal(self, symbol: str) -> bool:
         """Check if symbol is a metal."""
-        metals = ['XAUUSD', 'XAGUSD', 'XPTUSD', 'XPDUSD', 'GOLD', 'SILVER', 'PLATINUM', 'PALLADIUM']
-        return symbol in metals or any(symbol.startswith(m) for m in ['XAU', 'XAG', 'XPT', 'XPD'])
+        return symbol in self._METALS or symbol.startswith(self._METAL_PREFIXES)
 
     def _is_crypto(self, symbol: str) -> bool:
         """Check if symbol is cryptocurrency."""
-        crypto_patterns = ['BTC', 'ETH', 'LTC', 'XRP', 'BCH', 'ADA', 'DOT', 'LINK', 'DOGE', 'USDT']
-        return any(pattern in symbol for pattern in crypto_patterns)
+        return self._CRYPTO_RE.search(symbol) is not None
 
     def _is_commodity(self, symbol: str) -> bool:
         """Check if symbol is commodity."""
-        commodities = ['WTIUSD', 'BRENTUSD', 'NATGAS', 'CORN', 'WHEAT', 'SOYBEANS', 'SUGAR', 'COFFEE']
-        return symbol in commodities or any(symbol.startswith(c) for c in ['WTI', 'BRENT', 'NGAS', 'CL', 'GC', 'SI', 'CU', 'NG'])
+        return symbol in self._COMMODITIES or symbol.startswith(self._COMMODITY_PREFIXES)
 
     def _is_index(self, symbol: str) -> bool:
         """Check if symbol is an index."""
-        index_patterns = ['SPX', 'NDX', 'DAX', 'CAC', 'FTSE', 'NIKKEI', 'ASX', 'SENSEX', 'HANG', 'INDEX']
-        return any(pattern in symbol for pattern in index_patterns)
+        return self._INDEX_RE.search(symbol) is not None
 
     def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a symbol.
         
+        Results are reused for ``info_cache_ttl_seconds`` so bursts of calls
+        for the same symbol cost a single MT5 request.
+        
         Args:
             symbol: Symbol name
             
         Returns:
             Optional[Dict[str, Any]]: Symbol information or None.
         """
+        now = time.monotonic()
+        with self._info_cache_lock:
+            entry = self._info_cache.get(symbol)
+            if entry is not None and now - entry[0] < self._info_ttl:
+                self._info_cache.move_to_end(symbol)
+                return dict(entry[1])
+
         try:
             sym_info = mt5.symbol_info(symbol)
             if sym_info is None:
                 self.logger.warning(f"Symbol not found: {symbol}")
                 return None
 
-            return {
-                'name': sym_info.name,
-                'description': sym_info.description,
-                'bid': sym_info.bid,
-                'ask': sym_info.ask,
-                'digits': sym_info.digits,
-                'spread': sym_info.spread,
-                'spread_float': sym_info.spread_float,
-                'volume': sym_info.volume,
-                'volume_high': sym_info.volume_high,
-                'volume_low': sym_info.volume_low,
-                'time': sym_info.time,
-                'trade_mode': sym_info.trade_mode,
-                'trade_execution': sym_info.trade_execution,
-                'session_deals': sym_info.session_deals,
-                'session_buy_orders': sym_info.session_buy_orders,
-                'session_sell_orders': sym_info.session_sell_orders,
-                'volume_real': sym_info.volume_real,
-                'volume_high_real': sym_info.volume_high_real,
-                'volume_low_real': sym_info.volume_low_real,
-            }
+            info = dict(zip(self.INFO_FIELDS, self._get_info_fields(sym_info)))
 
         except Exception as e:
             self.logger.error(f"Error retrieving symbol info for {symbol}: {e}")
             return None
 
+        with self._info_cache_lock:
+            self._info_cache[symbol] = (now, info)
+            self._info_cache.move_to_end(symbol)
+            while len(self._info_cache) > self._max_info_entries:
+                self._info_cache.popitem(last=False)
+        return dict(info)
+
+    def get_symbol_static_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the fields of a symbol that do not change between ticks.
+        
+        Cached until the symbol is removed on refresh, so prefer this over
+        get_symbol_info when prices are not needed.
+        
+        Args:
+            symbol: Symbol name
+            
+        Returns:
+            Optional[Dict[str, Any]]: STATIC_INFO_FIELDS of the symbol or None.
+        """
+        static = self._static_info_cache.get(symbol)
+        if static is None:
+            info = self.get_symbol_info(symbol)
+            if info is None:
+                return None
+            static = {field: info[field] for field in self.STATIC_INFO_FIELDS}
+            self._static_info_cache[symbol] = static
+        return dict(static)
+
+    def _evict_symbol_info(self, symbols: list[str]) -> None:
+        """Drop cached symbol_info entries for the given symbols."""
+        with self._info_cache_lock:
+            for symbol in symbols:
+                self._info_cache.pop(symbol, None)
+                self._static_info_cache.pop(symbol, None)
+
     def get_category_symbols(self, category: str) -> list[str]:
         """
         Get symbols in a specific category.
@@ -218,19 +372,32 @@ class SymbolManager:
         """Register callback for removed symbols."""
         self._on_removed_symbols.append(callback)
 
+    def _submit_callbacks(self, name: str, callbacks: list[Callable], *args) -> list[tuple[str, Future]]:
+        """Submit callbacks to the callback pool, tagging each future with name."""
+        submit = self._cb_pool.submit
+        return [(name, submit(callback, *args)) for callback in callbacks]
+
+    def _wait_callbacks(self, futures: list[tuple[str, Future]]) -> None:
+        """Wait for submitted callbacks, logging any that fail or time out."""
+        error = self.logger.error
+        timeout = self._callback_timeout
+        for name, future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                error(f"Error in {name} callback: {e!r}")
+
     def refresh(self) -> bool:
         """
         Refresh symbol list and categories from MT5.
         
-        Detects new/removed symbols and triggers callbacks.
+        Detects new/removed symbols and triggers callbacks. When the symbol
+        set is unchanged since the last refresh only the timestamp is updated.
         
         Returns:
             bool: True if refresh successful, False otherwise.
         """
         try:
-            # Get previous symbols
-            old_symbols = set(self._symbol_cache.keys())
-            
             # Fetch new symbols from MT5
             symbols = self.get_all_symbols()
             if symbols is None:
@@ -239,15 +406,29 @@ class SymbolManager:
             
             new_symbols = set(symbols)
             
+            # Nothing changed since the last refresh: skip re-categorization and callbacks
+            if self._last_refresh is not None and new_symbols == self._symbol_cache:
+                self._last_refresh = datetime.now()
+                self.logger.debug(f"Symbol list unchanged ({len(symbols)} symbols)")
+                return True
+            
             # Detect changes
-            added_symbols = list(new_symbols - old_symbols)
-            removed_symbols = list(old_symbols - new_symbols)
+            added_symbols = list(new_symbols - self._symbol_cache)
+            removed_symbols = list(self._symbol_cache - new_symbols)
             
             # Update cache
-            self._symbol_cache = {s: None for s in symbols}
+            self._symbol_cache = new_symbols
+            if removed_symbols:
+                self._evict_symbol_info(removed_symbols)
             
-            # Re-categorize
-            self.categorize_symbols()
+            # Re-categorize only what changed since the last categorization
+            if self._sym_to_cat:
+                self._apply_category_delta(
+                    new_symbols.difference(self._sym_to_cat),
+                    self._sym_to_cat.keys() - new_symbols
+                )
+            else:
+                self.categorize_symbols(symbols)
             
             # Update timestamp
             self._last_refresh = datetime.now()
@@ -258,26 +439,13 @@ class SymbolManager:
             if removed_symbols:
                 self.logger.info(f"Removed {len(removed_symbols)} symbols: {removed_symbols[:5]}...")
             
-            # Trigger callbacks
-            for callback in self._on_symbols_refreshed:
-                try:
-                    callback()
-                except Exception as e:
-                    self.logger.error(f"Error in symbols_refreshed callback: {e}")
-            
+            # Trigger callbacks concurrently, then wait for all of them
+            futures = self._submit_callbacks('symbols_refreshed', self._on_symbols_refreshed)
             if added_symbols:
-                for callback in self._on_new_symbols:
-                    try:
-                        callback(added_symbols)
-                    except Exception as e:
-                        self.logger.error(f"Error in new_symbols callback: {e}")
-            
+                futures += self._submit_callbacks('new_symbols', self._on_new_symbols, added_symbols)
             if removed_symbols:
-                for callback in self._on_removed_symbols:
-                    try:
-                        callback(removed_symbols)
-                    except Exception as e:
-                        self.logger.error(f"Error in removed_symbols callback: {e}")
+                futures += self._submit_callbacks('removed_symbols', self._on_removed_symbols, removed_symbols)
+            self._wait_callbacks(futures)
             
             self.logger.info(f"Symbol refresh completed. Total symbols: {len(symbols)}")
             return True
@@ -294,3 +462,7 @@ class SymbolManager:
         """Check if symbol exists in current cache."""
         return symbol in self._symbol_cache
 
+    def close(self) -> None:
+        """Shut down the refresh callback thread pool."""
+        self._cb_pool.shutdown(wait=True)
+
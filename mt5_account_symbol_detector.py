@@ -8,16 +8,18 @@ Author: Strelitzia System
 Date: December 27, 2025
 """
 
+import functools
+import importlib
+import io
 import os
 import sys
 import platform
-import subprocess
+import re
 import logging
-from pathlib import Path
-from datetime import datetime
-from pathlib import Path
+import threading
 from typing import List, Dict, Optional, Tuple
 import time
+from operator import attrgetter
 
 # Try to import MetaTrader5
 try:
@@ -28,6 +30,103 @@ except ImportError:
     print("⚠️  MetaTrader5 package not found. Install with: pip install MetaTrader5")
 
 
+# Seconds to wait for a freshly launched MT5 terminal to appear
+MT5_START_TIMEOUT = 30
+
+# The OS cannot change while the process runs, so detect it once
+_OS = platform.system()
+_OS_NAME = {
+    'Windows': 'Windows',
+    'Linux': 'Linux (WINE)',
+    'Darwin': 'macOS'
+}.get(_OS, 'Unknown')
+_PYTHON_VERSION = platform.python_version()
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import an optional module on first use; None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _enable_vt() -> bool:
+    """Enable ANSI escape handling once; False if the console refused it."""
+    if _OS != 'Windows':
+        return True
+    # An empty command makes cmd.exe switch the console into VT mode (Windows 10+)
+    return os.system('') == 0
+
+
+def _mt5_running_windows() -> bool:
+    """Check for a running terminal.exe on Windows."""
+    psutil = _optional_module('psutil')
+    if psutil is not None:
+        # Fetch only the name, in one pass; it is None for processes we may not inspect
+        return any(
+            'terminal.exe' in (proc.info['name'] or '').lower()
+            for proc in psutil.process_iter(['name'])
+        )
+    
+    # Fallback: try to get MT5 window
+    win32gui = _optional_module('win32gui')
+    if win32gui is None:
+        return False
+    try:
+        return win32gui.FindWindow(None, 'MetaTrader 5') != 0
+    except:
+        return False
+
+
+def _mt5_running_pgrep(pattern: str) -> bool:
+    """Check for a WINE-hosted terminal.exe matching pattern via pgrep."""
+    import subprocess
+    try:
+        result = subprocess.run(['pgrep', '-f', pattern],
+                                capture_output=True, timeout=2)
+        return result.returncode == 0
+    except:
+        return False
+
+
+# Path of the WINE MT5 terminal once found; probing is skipped afterwards
+_MT5_EXE_CACHE: Optional[str] = None
+
+
+def _find_mt5_exe() -> Optional[str]:
+    """Locate terminal.exe under the usual WINE/manual install paths."""
+    global _MT5_EXE_CACHE
+    if _MT5_EXE_CACHE is not None:
+        return _MT5_EXE_CACHE
+    
+    # Most likely locations first; one stat() per candidate
+    wine_c = os.path.join(os.path.expanduser('~'), '.wine', 'drive_c')
+    possible_paths = (
+        os.path.join(wine_c, 'Program Files', 'MetaTrader 5', 'terminal.exe'),
+        os.path.join(wine_c, 'Program Files (x86)', 'MetaTrader 5', 'terminal.exe'),
+        '/opt/mt5/terminal.exe',
+        '/usr/local/mt5/terminal.exe',
+    )
+    for path in possible_paths:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        _MT5_EXE_CACHE = path
+        return path
+    return None
+
+
+_MT5_RUNNING_CHECKS = {
+    'Windows': _mt5_running_windows,
+    'Linux': functools.partial(_mt5_running_pgrep, 'wine.*terminal.exe'),
+    'Darwin': functools.partial(_mt5_running_pgrep, 'Wine.*terminal.exe'),  # macOS
+}
+
+
 class OSDetector:
     """Detect operating system and manage MT5 startup."""
     
@@ -37,53 +136,18 @@ class OSDetector:
         Detect operating system.
         Returns: 'Windows', 'Linux', or 'Darwin' (macOS)
         """
-        system = platform.system()
-        return system
+        return _OS
     
     @staticmethod
     def get_os_name() -> str:
         """Get human-readable OS name."""
-        os_map = {
-            'Windows': 'Windows',
-            'Linux': 'Linux (WINE)',
-            'Darwin': 'macOS'
-        }
-        return os_map.get(OSDetector.get_os(), 'Unknown')
+        return _OS_NAME
     
     @staticmethod
     def is_mt5_running() -> bool:
         """Check if MT5 process is running."""
-        current_os = OSDetector.get_os()
-        
-        if current_os == 'Windows':
-            try:
-                import psutil
-                return any('terminal.exe' in proc.name().lower() for proc in psutil.process_iter())
-            except ImportError:
-                # Fallback: try to get MT5 window
-                try:
-                    import win32gui
-                    return win32gui.FindWindow(None, 'MetaTrader 5') != 0
-                except:
-                    return False
-        
-        elif current_os == 'Linux':
-            try:
-                result = subprocess.run(['pgrep', '-f', 'wine.*terminal.exe'], 
-                                      capture_output=True, timeout=2)
-                return result.returncode == 0
-            except:
-                return False
-        
-        elif current_os == 'Darwin':  # macOS
-            try:
-                result = subprocess.run(['pgrep', '-f', 'Wine.*terminal.exe'], 
-                                      capture_output=True, timeout=2)
-                return result.returncode == 0
-            except:
-                return False
-        
-        return False
+        check = _MT5_RUNNING_CHECKS.get(_OS)
+        return check() if check is not None else False
     
     @staticmethod
     def start_mt5_wine() -> bool:
@@ -91,40 +155,42 @@ class OSDetector:
         Start MT5 using WINE on Linux.
         Returns: True if started successfully, False otherwise
         """
+        import subprocess
         try:
-            # Try to find MT5 installation using pathlib for cross-platform compatibility
-            home = Path.home()
-            possible_paths = [
-                home / '.wine/drive_c/Program Files/MetaTrader 5/terminal.exe',
-                home / '.wine/drive_c/Program Files (x86)/MetaTrader 5/terminal.exe',
-                Path('/opt/mt5/terminal.exe'),
-                Path('/usr/local/mt5/terminal.exe')
-            ]
-            
-            mt5_exe = None
-            for path in possible_paths:
-                if path.exists():
-                    mt5_exe = str(path)
-                    break
-            
+            mt5_exe = _find_mt5_exe()
             if not mt5_exe:
                 print("❌ MT5 installation not found. Please install MT5 via WINE first.")
                 return False
             
             print(f"📡 Starting MT5 from: {mt5_exe}")
-            subprocess.Popen(['wine', mt5_exe], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            # Wait for MT5 to fully initialize
-            print("⏳ Waiting for MT5 to initialize... (30 seconds)")
-            for i in range(30):
-                time.sleep(1)
+            launcher = subprocess.Popen(['wine', mt5_exe], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            
+            # Wait for MT5 to fully initialize, polling quickly at first and
+            # backing off to once a second. Waiting on the launcher instead of
+            # sleeping lets a failed start end the wait straight away.
+            print(f"⏳ Waiting for MT5 to initialize... ({MT5_START_TIMEOUT} seconds)")
+            start = time.monotonic()
+            delay = 0.05
+            while True:
+                if launcher.poll() is None:
+                    try:
+                        launcher.wait(timeout=delay)
+                    except subprocess.TimeoutExpired:
+                        pass
+                else:
+                    time.sleep(delay)
+                if launcher.returncode:
+                    print(f"❌ WINE exited with code {launcher.returncode}")
+                    return False
                 if OSDetector.is_mt5_running():
                     print("✅ MT5 started successfully!")
                     return True
-                sys.stdout.write(f"\r  {i+1}/30 seconds... ")
+                elapsed = time.monotonic() - start
+                if elapsed >= MT5_START_TIMEOUT:
+                    return False
+                sys.stdout.write(f"\r  {int(elapsed)}/{MT5_START_TIMEOUT} seconds... ")
                 sys.stdout.flush()
-            
-            return False
+                delay = min(delay * 2, 1.0, MT5_START_TIMEOUT - elapsed)
         except Exception as e:
             print(f"❌ Error starting MT5: {e}")
             return False
@@ -146,6 +212,7 @@ class OSDetector:
             if response == 'y':
                 try:
                     # Try to find and start MT5
+                    import subprocess
                     subprocess.Popen('C:\\Program Files\\MetaTrader 5\\terminal.exe')
                     time.sleep(10)
                     if OSDetector.is_mt5_running():
@@ -178,6 +245,62 @@ class OSDetector:
         return False
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that collects formatted records and writes them in batches.
+    
+    The buffer is written with a single write() once it holds `capacity`
+    records, `flush_interval` seconds after the first buffered record, on any
+    ERROR or higher record, or when the handler is flushed/closed.
+    """
+    
+    def __init__(self, filename: str, capacity: int = 8000,
+                 flush_interval: float = 1.0, encoding: str = 'utf-8'):
+        """Initialize handler."""
+        super().__init__(filename, encoding=encoding)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord):
+        """Buffer a record, writing the batch out when due."""
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        
+        with self.lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.capacity or record.levelno >= logging.ERROR:
+                self._write_buffer()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _write_buffer(self):
+        """Write buffered lines in one call. Caller holds self.lock."""
+        if self._buffer and self.stream is not None:
+            self.stream.write(''.join(self._buffer))
+            self.stream.flush()
+            self._buffer.clear()
+    
+    def flush(self):
+        """Write out everything buffered so far."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write_buffer()
+    
+    def close(self):
+        """Flush buffered records and close the file."""
+        self.flush()
+        super().close()
+
+
 class CrossPlatformLogger:
     """Handle cross-platform logging to file and console."""
     
@@ -193,20 +316,25 @@ class CrossPlatformLogger:
             level=logging.INFO,
             format='%(asctime)s | %(levelname)s | %(message)s',
             handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
+                BufferedFileHandler(self.log_file, encoding='utf-8'),
                 logging.StreamHandler()
             ]
         )
         self.logger = logging.getLogger(__name__)
     
     def log_startup(self):
-        """Log application startup."""
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"MT5 Account & Symbol Detector Started")
-        self.logger.info(f"Operating System: {self.os_name}")
-        self.logger.info(f"Python Version: {platform.python_version()}")
-        self.logger.info(f"Timestamp: {datetime.now().isoformat()}")
-        self.logger.info(f"{'='*60}")
+        """Log application startup as a single multi-line record."""
+        from datetime import datetime
+        
+        separator = '='*60
+        self.logger.info('\n'.join((
+            separator,
+            "MT5 Account & Symbol Detector Started",
+            f"Operating System: {self.os_name}",
+            f"Python Version: {_PYTHON_VERSION}",
+            f"Timestamp: {datetime.now().isoformat()}",
+            separator,
+        )))
     
     def log_account(self, account_info: Dict):
         """Log account information."""
@@ -214,11 +342,22 @@ class CrossPlatformLogger:
                         f"Broker: {account_info.get('server', 'N/A')} | "
                         f"Balance: {account_info.get('balance', 'N/A')}")
     
+    @staticmethod
+    def _symbol_line(account: int, symbol: str, details: Dict) -> str:
+        """Format one symbol log line."""
+        return (f"SYMBOL | Account: {account} | Symbol: {symbol} | "
+                f"Type: {details.get('type', 'N/A')} | "
+                f"Pip: {details.get('pip', 'N/A')}")
+    
     def log_symbol(self, account: int, symbol: str, details: Dict):
         """Log symbol information."""
-        self.logger.info(f"SYMBOL | Account: {account} | Symbol: {symbol} | "
-                        f"Type: {details.get('type', 'N/A')} | "
-                        f"Pip: {details.get('pip', 'N/A')}")
+        self.logger.info(self._symbol_line(account, symbol, details))
+    
+    def log_symbols_bulk(self, account: int, rows: List[Tuple[str, Dict]]):
+        """Log many (symbol, details) rows as a single multi-line record."""
+        if rows:
+            line = self._symbol_line
+            self.logger.info('\n'.join(line(account, symbol, details) for symbol, details in rows))
     
     def log_error(self, error_type: str, message: str):
         """Log error."""
@@ -227,6 +366,11 @@ class CrossPlatformLogger:
     def log_info(self, message: str):
         """Log info message."""
         self.logger.info(f"INFO | {message}")
+    
+    def flush(self):
+        """Write any buffered log records to disk."""
+        for handler in logging.getLogger().handlers:
+            handler.flush()
 
 
 class MT5Connector:
@@ -272,6 +416,11 @@ class MT5Connector:
 class AccountManager:
     """Retrieve and manage MT5 accounts."""
     
+    # account_info fields kept in the account dict, read in one attrgetter call
+    ACCOUNT_FIELDS = ('login', 'server', 'balance', 'equity', 'currency', 'leverage',
+                      'margin', 'margin_free', 'margin_level', 'profit', 'name')
+    _get_account_fields = staticmethod(attrgetter(*ACCOUNT_FIELDS))
+    
     def __init__(self, connector: MT5Connector, logger: CrossPlatformLogger):
         """Initialize account manager."""
         self.connector = connector
@@ -295,19 +444,7 @@ class AccountManager:
                 self.logger.log_error('ACCOUNT_DETECTION', 'No account information available')
                 return []
             
-            account_dict = {
-                'login': account_info.login,
-                'server': account_info.server,
-                'balance': account_info.balance,
-                'equity': account_info.equity,
-                'currency': account_info.currency,
-                'leverage': account_info.leverage,
-                'margin': account_info.margin,
-                'margin_free': account_info.margin_free,
-                'margin_level': account_info.margin_level,
-                'profit': account_info.profit,
-                'name': account_info.name,
-            }
+            account_dict = dict(zip(self.ACCOUNT_FIELDS, self._get_account_fields(account_info)))
             
             self.accounts = [account_dict]
             self.logger.log_account(account_dict)
@@ -322,6 +459,21 @@ class AccountManager:
         return self.accounts
 
 
+def _build_category_patterns(categories: Dict[str, List[str]]) -> Tuple[Tuple[str, 're.Pattern'], ...]:
+    """
+    Compile each category's tokens into a single regex alternation.
+    
+    Tokens with lower-case letters can never occur in an upper-cased symbol
+    name, so they are left out; categories left without tokens are skipped.
+    """
+    patterns = []
+    for category, tokens in categories.items():
+        tokens = [re.escape(token) for token in tokens if token == token.upper()]
+        if tokens:
+            patterns.append((category, re.compile('|'.join(tokens))))
+    return tuple(patterns)
+
+
 class SymbolManager:
     """Retrieve and manage MT5 symbols."""
     
@@ -337,6 +489,15 @@ class SymbolManager:
         'Stocks': []
     }
     
+    # One compiled alternation per category, in SYMBOL_CATEGORIES order
+    _CATEGORY_PATTERNS = _build_category_patterns(SYMBOL_CATEGORIES)
+    
+    # Fallback heuristics for names no category token matched
+    _CURRENCY_RE = re.compile('USD|EUR|GBP|JPY|CHF|CAD|AUD|NZD')
+    _METAL_RE = re.compile('XAU|XAG|XPT|XPD')
+    _CRYPTO_RE = re.compile('BTC|ETH|XRP|LTC|BCH')
+    _SYNTH_RE = re.compile('BOOM|CRASH|RISE|FALL|VOLATILITY')
+    
     def __init__(self, connector: MT5Connector, logger: CrossPlatformLogger):
         """Initialize symbol manager."""
         self.connector = connector
@@ -371,12 +532,16 @@ class SymbolManager:
                 'Other': []
             }
             
+            log_rows = []
             for symbol in all_symbols:
                 symbol_info = self._get_symbol_details(symbol)
                 if symbol_info:
                     category = self._categorize_symbol(symbol.name)
                     categorized[category].append(symbol_info)
-                    self.logger.log_symbol(account_login, symbol.name, symbol_info)
+                    log_rows.append((symbol.name, symbol_info))
+            
+            # One log record for the whole symbol list instead of one per symbol
+            self.logger.log_symbols_bulk(account_login, log_rows)
             
             self.symbols = categorized
             return categorized
@@ -387,31 +552,50 @@ class SymbolManager:
     
     def _categorize_symbol(self, symbol_name: str) -> str:
         """Categorize a symbol by name."""
-        symbol_upper = symbol_name.upper()
-        
-        for category, symbols_list in self.SYMBOL_CATEGORIES.items():
-            if any(sym in symbol_upper for sym in symbols_list):
+        return self._category_for(symbol_name.upper())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8192)
+    def _category_for(cls, symbol_upper: str) -> str:
+        """Categorize an upper-cased symbol name (cached)."""
+        for category, pattern in cls._CATEGORY_PATTERNS:
+            if pattern.search(symbol_upper):
                 return category
         
         # Additional checks
-        if any(x in symbol_upper for x in ['USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD']):
-            if symbol_upper.count('USD') == 1 or any(x in symbol_upper for x in ['EURUSD', 'GBPUSD']):
+        if cls._CURRENCY_RE.search(symbol_upper):
+            if symbol_upper.count('USD') == 1 or 'EURUSD' in symbol_upper or 'GBPUSD' in symbol_upper:
                 return 'Forex'
         
-        if any(x in symbol_upper for x in ['XAU', 'XAG', 'XPT', 'XPD']):
+        if cls._METAL_RE.search(symbol_upper):
             return 'Commodities'
         
-        if any(x in symbol_upper for x in ['BTC', 'ETH', 'XRP', 'LTC', 'BCH']):
+        if cls._CRYPTO_RE.search(symbol_upper):
             return 'Crypto'
         
-        if any(x in symbol_upper for x in ['BOOM', 'CRASH', 'RISE', 'FALL', 'VOLATILITY']):
+        if cls._SYNTH_RE.search(symbol_upper):
             return 'Synthetics'
         
         return 'Other'
     
+    # Optional SymbolInfo fields, probed once per symbol type (MT5 build)
+    _OPTIONAL_FIELDS = ('margin_initial', 'session_open', 'session_close')
+    _optional_fields_by_type: Dict[type, Tuple[bool, ...]] = {}
+    
+    @classmethod
+    def _optional_fields(cls, symbol) -> Tuple[bool, ...]:
+        """Return which of _OPTIONAL_FIELDS the symbol's type provides."""
+        kind = type(symbol)
+        present = cls._optional_fields_by_type.get(kind)
+        if present is None:
+            present = tuple(hasattr(symbol, field) for field in cls._OPTIONAL_FIELDS)
+            cls._optional_fields_by_type[kind] = present
+        return present
+    
     def _get_symbol_details(self, symbol) -> Optional[Dict]:
         """Get detailed information for a symbol."""
         try:
+            has_margin, has_session_open, has_session_close = self._optional_fields(symbol)
             return {
                 'name': symbol.name,
                 'description': symbol.description,
@@ -421,11 +605,11 @@ class SymbolManager:
                 'ask': symbol.ask,
                 'type': self._get_symbol_type(symbol),
                 'contract_size': symbol.trade_contract_size,
-                'margin': symbol.margin_initial if hasattr(symbol, 'margin_initial') else 'N/A',
+                'margin': symbol.margin_initial if has_margin else 'N/A',
                 'point_value': symbol.trade_contract_size * symbol.point,
                 'trade_mode': symbol.trade_mode,
-                'session_open': getattr(symbol, 'session_open', 'N/A'),
-                'session_close': getattr(symbol, 'session_close', 'N/A'),
+                'session_open': symbol.session_open if has_session_open else 'N/A',
+                'session_close': symbol.session_close if has_session_close else 'N/A',
             }
         except Exception as e:
             self.logger.log_error('SYMBOL_DETAILS', f'Symbol: {symbol.name}, Error: {str(e)}')
@@ -457,20 +641,24 @@ class TerminalUI:
     @staticmethod
     def clear_screen():
         """Clear terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if sys.stdout.isatty() and _enable_vt():
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     @staticmethod
-    def print_header(title: str):
+    def print_header(title: str, file=None):
         """Print formatted header."""
-        print("\n" + "="*80)
-        print(f"  {title}".ljust(80))
-        print("="*80 + "\n")
+        print("\n" + "="*80, file=file)
+        print(f"  {title}".ljust(80), file=file)
+        print("="*80 + "\n", file=file)
     
     @staticmethod
-    def print_section(title: str):
+    def print_section(title: str, file=None):
         """Print formatted section."""
-        print(f"\n{title}")
-        print("-" * 80)
+        print(f"\n{title}", file=file)
+        print("-" * 80, file=file)
     
     @staticmethod
     def display_accounts(accounts: List[Dict]) -> Optional[Dict]:
@@ -481,17 +669,22 @@ class TerminalUI:
         
         TerminalUI.print_header("Available MT5 Accounts")
         
+        lines = []
         for idx, account in enumerate(accounts, 1):
-            print(f"\n📊 Account {idx}:")
-            print(f"  Login:       {account.get('login', 'N/A')}")
-            print(f"  Server:      {account.get('server', 'N/A')}")
-            print(f"  Name:        {account.get('name', 'N/A')}")
-            print(f"  Balance:     {account.get('balance', 'N/A')} {account.get('currency', 'N/A')}")
-            print(f"  Equity:      {account.get('equity', 'N/A')} {account.get('currency', 'N/A')}")
-            print(f"  Leverage:    1:{account.get('leverage', 'N/A')}")
-            print(f"  Margin:      {account.get('margin', 'N/A')} {account.get('currency', 'N/A')}")
-            print(f"  Margin Free: {account.get('margin_free', 'N/A')} {account.get('currency', 'N/A')}")
-            print(f"  Profit:      {account.get('profit', 'N/A')} {account.get('currency', 'N/A')}")
+            currency = account.get('currency', 'N/A')
+            lines.append(
+                f"\n📊 Account {idx}:\n"
+                f"  Login:       {account.get('login', 'N/A')}\n"
+                f"  Server:      {account.get('server', 'N/A')}\n"
+                f"  Name:        {account.get('name', 'N/A')}\n"
+                f"  Balance:     {account.get('balance', 'N/A')} {currency}\n"
+                f"  Equity:      {account.get('equity', 'N/A')} {currency}\n"
+                f"  Leverage:    1:{account.get('leverage', 'N/A')}\n"
+                f"  Margin:      {account.get('margin', 'N/A')} {currency}\n"
+                f"  Margin Free: {account.get('margin_free', 'N/A')} {currency}\n"
+                f"  Profit:      {account.get('profit', 'N/A')} {currency}\n"
+            )
+        sys.stdout.write(''.join(lines))
         
         if len(accounts) == 1:
             return accounts[0]
@@ -509,28 +702,35 @@ class TerminalUI:
     @staticmethod
     def display_symbols(symbols_dict: Dict[str, List[Dict]]):
         """Display all symbols organized by category."""
-        TerminalUI.print_header("Available Symbols")
+        # Compose the whole listing in memory and hand it to stdout in one write
+        buf = io.StringIO()
+        write = buf.write
+        TerminalUI.print_header("Available Symbols", file=buf)
         
         total_symbols = sum(len(v) for v in symbols_dict.values())
-        print(f"📈 Total Symbols Available: {total_symbols}\n")
+        write(f"📈 Total Symbols Available: {total_symbols}\n\n")
         
         for category, symbols in symbols_dict.items():
             if symbols:
-                TerminalUI.print_section(f"{category} ({len(symbols)} symbols)")
+                TerminalUI.print_section(f"{category} ({len(symbols)} symbols)", file=buf)
                 
                 # Display in columns for better readability
                 for idx, symbol in enumerate(symbols, 1):
-                    print(f"\n  {idx}. {symbol['name']}")
-                    print(f"     Description: {symbol['description']}")
-                    print(f"     Type: {symbol['type']}")
-                    print(f"     Pip/Point: {symbol['pip']}")
-                    print(f"     Digits: {symbol['digits']}")
-                    print(f"     Current Bid: {symbol['bid']}")
-                    print(f"     Current Ask: {symbol['ask']}")
-                    print(f"     Contract Size: {symbol['contract_size']}")
-                    print(f"     Point Value: {symbol['point_value']}")
-                    print(f"     Margin: {symbol['margin']}")
-                    print(f"     Trade Mode: {symbol['trade_mode']}")
+                    write(
+                        f"\n  {idx}. {symbol['name']}\n"
+                        f"     Description: {symbol['description']}\n"
+                        f"     Type: {symbol['type']}\n"
+                        f"     Pip/Point: {symbol['pip']}\n"
+                        f"     Digits: {symbol['digits']}\n"
+                        f"     Current Bid: {symbol['bid']}\n"
+                        f"     Current Ask: {symbol['ask']}\n"
+                        f"     Contract Size: {symbol['contract_size']}\n"
+                        f"     Point Value: {symbol['point_value']}\n"
+                        f"     Margin: {symbol['margin']}\n"
+                        f"     Trade Mode: {symbol['trade_mode']}\n"
+                    )
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     @staticmethod
     def display_summary(accounts: List[Dict], symbols_dict: Dict[str, List[Dict]]):
@@ -628,10 +828,12 @@ class MT5DetectorApp:
             # Save report
             self._save_detailed_report(selected_account, symbols)
             
-            print("\n" + "="*80)
-            print("✅ Application completed successfully!")
-            print(f"📁 Logs saved to: {self.logger.log_file}")
-            print("="*80 + "\n")
+            sys.stdout.write(
+                "\n" + "="*80 + "\n"
+                "✅ Application completed successfully!\n"
+                f"📁 Logs saved to: {self.logger.log_file}\n"
+                + "="*80 + "\n\n"
+            )
         
         except KeyboardInterrupt:
             print("\n\n⚠️  Application interrupted by user")
@@ -643,48 +845,53 @@ class MT5DetectorApp:
         
         finally:
             self.connector.disconnect()
+            self.logger.flush()
     
     def _save_detailed_report(self, account: Dict, symbols: Dict[str, List[Dict]]):
         """Save detailed report to file."""
         try:
             report_file = f"mt5_report_{account['login']}.txt"
             
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write("MT5 Account & Symbol Report\n")
-                f.write("="*80 + "\n\n")
-                
-                f.write("ACCOUNT INFORMATION\n")
-                f.write("-"*80 + "\n")
-                f.write(f"Login: {account['login']}\n")
-                f.write(f"Server: {account['server']}\n")
-                f.write(f"Name: {account['name']}\n")
-                f.write(f"Currency: {account['currency']}\n")
-                f.write(f"Balance: {account['balance']}\n")
-                f.write(f"Equity: {account['equity']}\n")
-                f.write(f"Leverage: 1:{account['leverage']}\n")
-                f.write(f"Margin: {account['margin']}\n")
-                f.write(f"Margin Free: {account['margin_free']}\n")
-                f.write(f"Margin Level: {account['margin_level']}\n")
-                f.write(f"Profit: {account['profit']}\n\n")
-                
-                for category, symbol_list in symbols.items():
-                    if symbol_list:
-                        f.write(f"\n{category.upper()} ({len(symbol_list)} symbols)\n")
-                        f.write("-"*80 + "\n")
-                        
-                        for symbol in symbol_list:
-                            f.write(f"\nSymbol: {symbol['name']}\n")
-                            f.write(f"  Description: {symbol['description']}\n")
-                            f.write(f"  Type: {symbol['type']}\n")
-                            f.write(f"  Pip: {symbol['pip']}\n")
-                            f.write(f"  Digits: {symbol['digits']}\n")
-                            f.write(f"  Bid: {symbol['bid']}\n")
-                            f.write(f"  Ask: {symbol['ask']}\n")
-                            f.write(f"  Contract Size: {symbol['contract_size']}\n")
-                            f.write(f"  Point Value: {symbol['point_value']}\n")
-                            f.write(f"  Margin: {symbol['margin']}\n")
-                            f.write(f"  Trade Mode: {symbol['trade_mode']}\n")
+            # Build the whole report in memory and write it in one call
+            parts = [
+                "="*80 + "\n"
+                "MT5 Account & Symbol Report\n"
+                + "="*80 + "\n\n"
+                "ACCOUNT INFORMATION\n"
+                + "-"*80 + "\n"
+                f"Login: {account['login']}\n"
+                f"Server: {account['server']}\n"
+                f"Name: {account['name']}\n"
+                f"Currency: {account['currency']}\n"
+                f"Balance: {account['balance']}\n"
+                f"Equity: {account['equity']}\n"
+                f"Leverage: 1:{account['leverage']}\n"
+                f"Margin: {account['margin']}\n"
+                f"Margin Free: {account['margin_free']}\n"
+                f"Margin Level: {account['margin_level']}\n"
+                f"Profit: {account['profit']}\n\n"
+            ]
+            
+            for category, symbol_list in symbols.items():
+                if symbol_list:
+                    parts.append(f"\n{category.upper()} ({len(symbol_list)} symbols)\n" + "-"*80 + "\n")
+                    parts.extend(
+                        f"\nSymbol: {symbol['name']}\n"
+                        f"  Description: {symbol['description']}\n"
+                        f"  Type: {symbol['type']}\n"
+                        f"  Pip: {symbol['pip']}\n"
+                        f"  Digits: {symbol['digits']}\n"
+                        f"  Bid: {symbol['bid']}\n"
+                        f"  Ask: {symbol['ask']}\n"
+                        f"  Contract Size: {symbol['contract_size']}\n"
+                        f"  Point Value: {symbol['point_value']}\n"
+                        f"  Margin: {symbol['margin']}\n"
+                        f"  Trade Mode: {symbol['trade_mode']}\n"
+                        for symbol in symbol_list
+                    )
+            
+            with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(parts)
             
             print(f"\n📄 Detailed report saved to: {report_file}")
             self.logger.log_info(f"Report saved to {report_file}")
@@ -6,6 +6,7 @@ Usage:
 import argparse
 import os
 import sys
+import threading
 
 THIS_DIR = os.path.dirname(__file__)
 if THIS_DIR not in sys.path:
@@ -29,8 +30,11 @@ if __name__ == '__main__':
 
     engine.start(args.symbol, args.timeframe, history_days=args.history, poll_interval=args.poll, update_cb=cb)
 
+    # Sleep until Ctrl+C instead of spinning a core. The timeout keeps the
+    # wait interruptible on Windows, where an untimed wait ignores Ctrl+C.
+    stop_event = threading.Event()
     try:
-        while True:
+        while not stop_event.wait(1.0):
             pass
     except KeyboardInterrupt:
         engine.stop()
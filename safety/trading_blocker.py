@@ -12,10 +12,22 @@ The application is strictly an analysis tool and must NEVER:
 - Modify positions
 """
 
-from typing import Any, Callable
+import atexit
+import logging
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional, Tuple
 from functools import wraps
+from config.settings import SAFETY_CONFIG
 from core.logger import get_logger
 
+try:
+    import MetaTrader5 as _mt5
+except ImportError:
+    _mt5 = None
+
 
 def analysis_only_mode(func: Callable) -> Callable:
     """
@@ -28,14 +40,20 @@ def analysis_only_mode(func: Callable) -> Callable:
     Returns:
         Callable: Wrapped function that raises error if called
     """
+    # The logger is a singleton and the messages never change, so both are
+    # resolved once at decoration time
+    logger = get_logger()
+    name = func.__name__
+    log_msg = f"BLOCKED TRADING OPERATION: {name}"
+    error_msg = (
+        f"SAFETY VIOLATION: {name} is not allowed in analysis-only mode. "
+        "Strelitzia Trader is strictly an analysis application and cannot execute trades."
+    )
+    
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        logger = get_logger()
-        logger.critical(f"BLOCKED TRADING OPERATION: {func.__name__}")
-        raise RuntimeError(
-            f"SAFETY VIOLATION: {func.__name__} is not allowed in analysis-only mode. "
-            "Strelitzia Trader is strictly an analysis application and cannot execute trades."
-        )
+        logger.critical(log_msg)
+        raise RuntimeError(error_msg)
     return wrapper
 
 
@@ -61,6 +79,9 @@ class TradingBlocker:
             'position_modify',
             'position_close',
         ]
+        # Exact names short-circuit; anything else is matched as a substring
+        self._blocked_set = frozenset(self.blocked_operations)
+        self._blocked_re = re.compile('|'.join(map(re.escape, self.blocked_operations)))
         self.logger.info("Trading blocker initialized - analysis-only mode enforced")
     
     def is_trading_function(self, function_name: str) -> bool:
@@ -73,8 +94,13 @@ class TradingBlocker:
         Returns:
             bool: True if function is trading-related
         """
+        # MT5 API names are already lower-case, so most calls never need lower()
+        if function_name in self._blocked_set:
+            return True
         function_lower = function_name.lower()
-        return any(op in function_lower for op in self.blocked_operations)
+        if function_lower in self._blocked_set:
+            return True
+        return self._blocked_re.search(function_lower) is not None
     
     def block_if_trading(self, function_name: str) -> None:
         """
@@ -87,7 +113,7 @@ class TradingBlocker:
             RuntimeError: If function is trading-related
         """
         if self.is_trading_function(function_name):
-            self.logger.critical(f"BLOCKED: Trading operation '{function_name}' attempted")
+            self.logger.critical("BLOCKED: Trading operation '%s' attempted", function_name)
             raise RuntimeError(
                 f"SAFETY VIOLATION: Cannot execute '{function_name}' in analysis-only mode.\n"
                 f"Strelitzia Trader is a market analysis tool only - it does not place trades."
@@ -104,6 +130,24 @@ class SafeAccountAccessor:
         """Initialize safe accessor."""
         self.logger = get_logger()
         self.access_count = 0
+        self._mt5 = _mt5
+        
+        # Access entries are logged in batches rather than one record each. No
+        # maxlen: eviction would silently drop audit entries, and appends flush
+        # once the configured batch size is reached anyway
+        self._log_buf: deque = deque()
+        self._batch_size = SAFETY_CONFIG.get('access_log_batch_size', 64)
+        # Opt-out for scripted bulk analysis: no counting, queueing or logging
+        self._audit_enabled = SAFETY_CONFIG.get('log_all_account_access', True)
+        self._flush_interval = SAFETY_CONFIG.get('access_log_flush_seconds', 1.0)
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush_access_log)
+    
+    def _require_mt5(self):
+        """Return the MetaTrader5 module, or raise if it is not installed."""
+        if self._mt5 is None:
+            raise ImportError("MetaTrader5 package not found. Install with: pip install MetaTrader5")
+        return self._mt5
     
     def log_account_access(self, access_type: str, details: str) -> None:
         """
@@ -114,8 +158,31 @@ class SafeAccountAccessor:
             access_type: Type of access (e.g., 'read_balance', 'read_positions')
             details: Additional details
         """
+        if not self._audit_enabled:
+            return
         self.access_count += 1
-        self.logger.info(f"Account access #{self.access_count}: {access_type} - {details}")
+        # Entries are formatted at flush time, and only if INFO is enabled. The
+        # interval is only checked here, so a quiet period leaves queued entries
+        # until the next access or interpreter exit
+        self._log_buf.append((self.access_count, access_type, details))
+        if (len(self._log_buf) >= self._batch_size
+                or time.monotonic() - self._last_flush >= self._flush_interval):
+            self.flush_access_log()
+    
+    def flush_access_log(self) -> None:
+        """Write all queued account access entries as a single log record."""
+        self._last_flush = time.monotonic()
+        entries = []
+        while self._log_buf:
+            try:
+                entries.append(self._log_buf.popleft())
+            except IndexError:
+                break
+        if entries and self.logger.get_logger().isEnabledFor(logging.INFO):
+            self.logger.info('\n'.join(
+                f"Account access #{count}: {access_type} - {details}"
+                for count, access_type, details in entries
+            ))
     
     def safe_read_balance(self) -> float:
         """
@@ -124,7 +191,7 @@ class SafeAccountAccessor:
         Returns:
             float: Account balance
         """
-        import MetaTrader5 as mt5
+        mt5 = self._require_mt5()
         try:
             account_info = mt5.account_info()
             if account_info:
@@ -133,37 +200,53 @@ class SafeAccountAccessor:
                 return balance
             return 0.0
         except Exception as e:
-            self.logger.error(f"Error reading balance: {e}")
+            self.logger.error("Error reading balance: %s", e)
             return 0.0
     
-    def safe_read_positions(self) -> list:
+    def safe_read_positions(self) -> Tuple[Any, ...]:
         """
         Safely read open positions (read-only, no modification).
         
         Returns:
-            list: Open positions (for informational purposes only)
+            tuple: Open positions as returned by MT5 (for informational purposes only)
         """
-        import MetaTrader5 as mt5
+        mt5 = self._require_mt5()
         try:
             positions = mt5.positions_get()
-            count = len(positions) if positions else 0
-            self.log_account_access("read_positions", f"count={count}")
-            return list(positions) if positions else []
+            self.log_account_access("read_positions", f"count={len(positions) if positions else 0}")
+            return positions if positions else ()
         except Exception as e:
-            self.logger.error(f"Error reading positions: {e}")
-            return []
+            self.logger.error("Error reading positions: %s", e)
+            return ()
 
 
-# Global trading blocker instance
-_trading_blocker = TradingBlocker()
-_account_accessor = SafeAccountAccessor()
+# Global instances, created on first use so importing this module stays cheap.
+# Creation is double-checked under a lock: two accessors would keep separate
+# access counters and interleave duplicate "Account access #N" audit entries.
+_trading_blocker: Optional[TradingBlocker] = None
+_account_accessor: Optional[SafeAccountAccessor] = None
+_instances_lock = threading.Lock()
 
 
 def get_trading_blocker() -> TradingBlocker:
     """Get global trading blocker instance."""
-    return _trading_blocker
+    global _trading_blocker
+    blocker = _trading_blocker
+    if blocker is None:
+        with _instances_lock:
+            blocker = _trading_blocker
+            if blocker is None:
+                blocker = _trading_blocker = TradingBlocker()
+    return blocker
 
 
 def get_safe_account_accessor() -> SafeAccountAccessor:
     """Get global safe account accessor instance."""
-    return _account_accessor
+    global _account_accessor
+    accessor = _account_accessor
+    if accessor is None:
+        with _instances_lock:
+            accessor = _account_accessor
+            if accessor is None:
+                accessor = _account_accessor = SafeAccountAccessor()
+    return accessor
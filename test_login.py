@@ -2,14 +2,19 @@
 """Test login endpoint to verify credentials."""
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 BASE_URL = 'http://localhost:8000'
 
+# One keep-alive connection pool shared by every test
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 # Test 1: GET login page
 print("=" * 60)
 print("Test 1: GET /login")
 try:
-    r = requests.get(f'{BASE_URL}/login', timeout=5)
+    r = session.get(f'{BASE_URL}/login', timeout=5)
     print(f"Status: {r.status_code}")
     print(f"Contains login form: {'form' in r.text.lower()}")
 except Exception as e:
@@ -19,7 +24,7 @@ except Exception as e:
 print("\n" + "=" * 60)
 print("Test 2: POST /login with correct JSON credentials")
 try:
-    r = requests.post(f'{BASE_URL}/login', 
+    r = session.post(f'{BASE_URL}/login', 
         json={'username': 'leblanc', 'password': 'the pale woman'},
         timeout=5)
     print(f"Status: {r.status_code}")
@@ -33,7 +38,9 @@ except Exception as e:
 print("\n" + "=" * 60)
 print("Test 3: POST /login with wrong credentials")
 try:
-    r = requests.post(f'{BASE_URL}/login',
+    # Drop the cookie from Test 2 so the rejection is judged on credentials alone
+    session.cookies.clear()
+    r = session.post(f'{BASE_URL}/login',
         json={'username': 'test', 'password': 'wrong'},
         timeout=5)
     print(f"Status: {r.status_code}")
@@ -46,7 +53,8 @@ except Exception as e:
 print("\n" + "=" * 60)
 print("Test 4: Check auth cookie after successful login")
 try:
-    session = requests.Session()
+    # Start without cookies so only this login can authenticate the session
+    session.cookies.clear()
     r = session.post(f'{BASE_URL}/login',
         json={'username': 'leblanc', 'password': 'the pale woman'},
         timeout=5)
@@ -0,0 +1,128 @@
+"""Tests for MarketDataManager caching, run against a stubbed MetaTrader5 module."""
+import os
+import sys
+import time
+import types
+
+import numpy as np
+import pytest
+
+# Ensure the project root is on sys.path so `mt5` and `core` resolve
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+    ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8'),
+])
+
+
+def _make_stub_mt5() -> types.ModuleType:
+    """Build a MetaTrader5 stand-in that serves one-minute bars and records fetches."""
+    stub = types.ModuleType('MetaTrader5')
+    for name, value in (('M1', 1), ('M5', 5), ('M15', 15), ('M30', 30), ('H1', 16385),
+                        ('H4', 16388), ('D1', 16408), ('W1', 32769), ('MN1', 49153)):
+        setattr(stub, f'TIMEFRAME_{name}', value)
+    stub.rate_requests = []
+    stub.tick_time_msc = 1
+
+    def copy_rates_from_pos(symbol, timeframe, start_pos, count):
+        stub.rate_requests.append(count)
+        end = int(time.time()) // 60 * 60
+        rates = np.zeros(count, dtype=RATES_DTYPE)
+        rates['time'] = end - 60 * np.arange(count)[::-1]
+        rates['open'] = rates['high'] = rates['low'] = 1.1
+        rates['close'] = 1.1 + np.arange(count) * 1e-4
+        rates['tick_volume'] = 10
+        return rates
+
+    def symbol_info_tick(symbol):
+        return types.SimpleNamespace(time_msc=stub.tick_time_msc)
+
+    stub.copy_rates_from_pos = copy_rates_from_pos
+    stub.symbol_info_tick = symbol_info_tick
+    return stub
+
+
+# The real package only exists on Windows; the manager imports it at module load
+sys.modules.setdefault('MetaTrader5', _make_stub_mt5())
+
+from mt5 import market_data  # noqa: E402
+
+
+@pytest.fixture
+def stub_mt5(monkeypatch):
+    stub = _make_stub_mt5()
+    monkeypatch.setattr(market_data, 'mt5', stub)
+    return stub
+
+
+@pytest.fixture
+def manager(stub_mt5):
+    return market_data.MarketDataManager(cache_dir=None)
+
+
+def test_get_cached_data_mutation_leaves_cache_unchanged(manager):
+    manager.get_candles('EURUSD', 'M1', 100)
+    expected = manager.get_cached_data('EURUSD', 'M1')['Close'].copy()
+
+    returned = manager.get_cached_data('EURUSD', 'M1')
+    returned.loc[returned.index[-1], 'Close'] = -1.0
+    returned['Open'] = 0.0
+
+    cached = manager.get_cached_data('EURUSD', 'M1')
+    assert cached['Close'].equals(expected)
+    assert (cached['Open'] != 0.0).all()
+
+
+def test_get_candles_mutation_leaves_cache_unchanged(manager, stub_mt5):
+    fetched = manager.get_candles('EURUSD', 'M1', 100)
+    expected = fetched['Close'].copy()
+    fetched.loc[fetched.index[-1], 'Close'] = -1.0
+
+    hit = manager.get_candles('EURUSD', 'M1', 100)
+    assert stub_mt5.rate_requests == [100]
+    assert hit['Close'].equals(expected)
+    hit.loc[hit.index[0], 'Close'] = -1.0
+    assert manager.get_cached_data('EURUSD', 'M1')['Close'].equals(expected)
+
+
+def test_cache_hit_honours_smaller_count(manager, stub_mt5):
+    full = manager.get_candles('EURUSD', 'M1', 100)
+
+    tail = manager.get_candles('EURUSD', 'M1', 40)
+    assert stub_mt5.rate_requests == [100]
+    assert len(tail) == 40
+    assert list(tail.index) == list(range(40))
+    assert tail['Close'].tolist() == full['Close'].tail(40).tolist()
+
+
+def test_larger_count_refetches(manager, stub_mt5):
+    manager.get_candles('EURUSD', 'M1', 100)
+
+    more = manager.get_candles('EURUSD', 'M1', 300)
+    assert stub_mt5.rate_requests == [100, 300]
+    assert len(more) == 300
+    assert len(manager.get_cached_data('EURUSD', 'M1')) == 300
+
+
+def test_force_refresh_refetches(manager, stub_mt5):
+    manager.get_candles('EURUSD', 'M1', 100)
+
+    refreshed = manager.get_candles('EURUSD', 'M1', 100, force_refresh=True)
+    assert stub_mt5.rate_requests == [100, 100]
+    assert len(refreshed) == 100
+
+
+def test_warm_rekeys_entry_for_current_tick(manager, stub_mt5):
+    manager._warm('EURUSD', 'M1', 100)
+    manager._warm('EURUSD', 'M1', 100)
+    assert stub_mt5.rate_requests == [100]
+
+    # A new tick makes the warmer top up the tail, after which get_candles hits
+    stub_mt5.tick_time_msc += 1
+    manager._warm('EURUSD', 'M1', 100)
+    assert len(stub_mt5.rate_requests) == 2 and stub_mt5.rate_requests[1] < 100
+    manager.get_candles('EURUSD', 'M1', 100)
+    assert len(stub_mt5.rate_requests) == 2
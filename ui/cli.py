@@ -4,6 +4,14 @@ import sys
 from typing import List, Optional, Dict, Any, Callable, Tuple
 from core.logger import get_logger
 
+# Horizontal rules shared by every CLI block
+_HR_EQ = "=" * 70
+_HR_DASH = "-" * 70
+_HDR_EQ = "\n" + _HR_EQ
+_HDR_DASH = "\n" + _HR_DASH
+_FTR_EQ = _HR_EQ + "\n"
+_FTR_DASH = _HR_DASH + "\n"
+
 
 class CLIInterface:
     """Command-line interface for user interaction with runtime commands."""
@@ -21,6 +29,22 @@ class CLIInterface:
         'exit': ('Exit the application', 'exit'),
     }
 
+    # Accepted answers, checked with a single hash lookup
+    _EXIT_ALIASES = frozenset({'q', 'quit', 'exit'})
+    _QUIT_ALIASES = frozenset({'q', 'quit'})
+    _YES = frozenset({'y', 'yes'})
+    _NO = frozenset({'n', 'no'})
+
+    _TIMEFRAMES = ('M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1', 'W1', 'MN1')
+
+    # Message prefixes by level for display_message
+    _PREFIX_MAP = {
+        "INFO": "[ℹ INFO]",
+        "WARNING": "[⚠ WARNING]",
+        "ERROR": "[❌ ERROR]",
+        "SUCCESS": "[✓ SUCCESS]",
+    }
+
     def __init__(self):
         """Initialize CLI."""
         self.logger = get_logger()
@@ -28,10 +52,10 @@ class CLIInterface:
 
     def print_header(self):
         """Print application header."""
-        print("\n" + "=" * 70)
+        print(_HDR_EQ)
         print(" " * 15 + "STRELITZIA TRADER - MetaTrader 5 Analysis Engine")
         print(" " * 20 + "Production-Grade Market Analysis System")
-        print("=" * 70 + "\n")
+        print(_FTR_EQ)
 
     def print_account_info(self, account_info: Dict[str, Any]):
         """Print account information."""
@@ -39,27 +63,30 @@ class CLIInterface:
             print("ERROR: Unable to retrieve account information\n")
             return
 
-        print("ACCOUNT INFORMATION")
-        print("-" * 70)
-        print(f"Login:           {account_info.get('login', 'N/A')}")
-        print(f"Account:         {account_info.get('name', 'N/A')}")
-        print(f"Broker Server:   {account_info.get('server', 'N/A')}")
-        print(f"Currency:        {account_info.get('currency', 'N/A')}")
-        print(f"Balance:         {account_info.get('balance', 'N/A'):.2f}")
-        print(f"Equity:          {account_info.get('equity', 'N/A'):.2f}")
-        print(f"Profit/Loss:     {account_info.get('profit', 'N/A'):.2f}")
-        print(f"Leverage:        1:{account_info.get('leverage', 'N/A')}")
-        print(f"Margin Level:    {account_info.get('margin_level', 'N/A'):.2f}%")
-        print(f"Trade Allowed:   {'Yes' if account_info.get('trade_allowed') else 'No'}")
-        print("-" * 70 + "\n")
+        lines = [
+            "ACCOUNT INFORMATION",
+            _HR_DASH,
+            f"Login:           {account_info.get('login', 'N/A')}",
+            f"Account:         {account_info.get('name', 'N/A')}",
+            f"Broker Server:   {account_info.get('server', 'N/A')}",
+            f"Currency:        {account_info.get('currency', 'N/A')}",
+            f"Balance:         {account_info.get('balance', 'N/A'):.2f}",
+            f"Equity:          {account_info.get('equity', 'N/A'):.2f}",
+            f"Profit/Loss:     {account_info.get('profit', 'N/A'):.2f}",
+            f"Leverage:        1:{account_info.get('leverage', 'N/A')}",
+            f"Margin Level:    {account_info.get('margin_level', 'N/A'):.2f}%",
+            f"Trade Allowed:   {'Yes' if account_info.get('trade_allowed') else 'No'}",
+            _FTR_DASH,
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def display_symbol_categories(self, categories: Dict[str, List[str]]):
         """Display available symbol categories."""
         print("\nAVAILABLE SYMBOL CATEGORIES")
-        print("-" * 70)
+        print(_HR_DASH)
         for idx, (category, symbols) in enumerate(categories.items(), 1):
             print(f"{idx}. {category:30} ({len(symbols):2} symbols)")
-        print("-" * 70 + "\n")
+        print(_FTR_DASH)
 
     def select_category(self, categories: Dict[str, List[str]]) -> Optional[str]:
         """Prompt user to select a symbol category."""
@@ -82,11 +109,10 @@ class CLIInterface:
 
     def display_symbols(self, symbols: List[str]):
         """Display list of symbols."""
-        print("\nSYMBOLS IN CATEGORY")
-        print("-" * 70)
-        for idx, symbol in enumerate(symbols, 1):
-            print(f"{idx:2}. {symbol}")
-        print("-" * 70 + "\n")
+        lines = ["\nSYMBOLS IN CATEGORY", _HR_DASH]
+        lines.extend(f"{idx:2}. {symbol}" for idx, symbol in enumerate(symbols, 1))
+        lines.append(_FTR_DASH)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def select_symbols(self, symbols: List[str]) -> Optional[List[str]]:
         """Prompt user to select symbols."""
@@ -102,25 +128,26 @@ class CLIInterface:
                 if choice.lower() == 'q':
                     return None
 
-                selections = [int(x.strip()) - 1 for x in choice.split(',')]
-                selected = [symbols[i] for i in selections if 0 <= i < len(symbols)]
+                selections = [int(x) - 1 for x in choice.split(',')]
+                valid = range(len(symbols))
+                out_of_range = [i + 1 for i in selections if i not in valid]
+                if out_of_range:
+                    print(f"Out of range: {out_of_range}. Enter numbers between 1 and {len(symbols)}.")
+                    continue
 
-                if selected:
-                    return selected
-                else:
-                    print("No valid selections. Please try again.")
-            except (ValueError, IndexError):
+                return [symbols[i] for i in selections]
+            except ValueError:
                 print("Invalid input. Please enter valid numbers.")
 
     def select_timeframes(self) -> Optional[List[str]]:
         """Prompt user to select timeframes."""
-        timeframes = ['M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1', 'W1', 'MN1']
+        timeframes = self._TIMEFRAMES
 
         print("\nAVAILABLE TIMEFRAMES")
-        print("-" * 70)
+        print(_HR_DASH)
         for idx, tf in enumerate(timeframes, 1):
             print(f"{idx}. {tf}")
-        print("-" * 70)
+        print(_HR_DASH)
 
         while True:
             try:
@@ -147,48 +174,48 @@ class CLIInterface:
 
     def display_analysis_result(self, result: Dict[str, Any]):
         """Display analysis result."""
-        print("\nANALYSIS RESULT")
-        print("=" * 70)
-        print(f"Symbol:                {result.get('symbol', 'N/A')}")
-        print(f"Timeframe:             {result.get('timeframe', 'N/A')}")
-        print(f"Broker:                {result.get('broker', 'N/A')}")
-        print(f"Rating:                {result.get('rating', 'N/A')}")
-        print(f"Confluence Score:      {result.get('confluence_score', 0):.1f}/100")
-        print(f"Confidence:            {result.get('confidence', 0):.1f}%")
-        print(f"Bullish Signals:       {result.get('bullish_signals', 0)}")
-        print(f"Bearish Signals:       {result.get('bearish_signals', 0)}")
-        print(f"Total Signal Methods:  {result.get('signal_count', 0)}")
+        lines = [
+            "\nANALYSIS RESULT",
+            _HR_EQ,
+            f"Symbol:                {result.get('symbol', 'N/A')}",
+            f"Timeframe:             {result.get('timeframe', 'N/A')}",
+            f"Broker:                {result.get('broker', 'N/A')}",
+            f"Rating:                {result.get('rating', 'N/A')}",
+            f"Confluence Score:      {result.get('confluence_score', 0):.1f}/100",
+            f"Confidence:            {result.get('confidence', 0):.1f}%",
+            f"Bullish Signals:       {result.get('bullish_signals', 0)}",
+            f"Bearish Signals:       {result.get('bearish_signals', 0)}",
+            f"Total Signal Methods:  {result.get('signal_count', 0)}",
+        ]
         
         if 'top_factors' in result and result['top_factors']:
-            print("\nTop Contributing Factors:")
+            lines.append("\nTop Contributing Factors:")
             for i, (source, weight) in enumerate(result['top_factors'][:5], 1):
-                print(f"  {i}. {source}: {weight:.2f}")
+                lines.append(f"  {i}. {source}: {weight:.2f}")
         
-        print("=" * 70 + "\n")
+        lines.append(_FTR_EQ)
 
         if 'error' in result:
-            print(f"ERROR: {result.get('error')}\n")
+            lines.append(f"ERROR: {result.get('error')}\n")
+        
+        # One write for the whole block
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
     def confirm_action(self, message: str) -> bool:
         """Prompt user for yes/no confirmation."""
         while True:
             response = input(f"{message} (y/n): ").strip().lower()
-            if response in ['y', 'yes']:
+            if response in self._YES:
                 return True
-            elif response in ['n', 'no']:
+            elif response in self._NO:
                 return False
             else:
                 print("Please enter 'y' or 'n'.")
 
     def display_message(self, message: str, level: str = "INFO"):
         """Display a message."""
-        prefix_map = {
-            "INFO": "[ℹ INFO]",
-            "WARNING": "[⚠ WARNING]",
-            "ERROR": "[❌ ERROR]",
-            "SUCCESS": "[✓ SUCCESS]",
-        }
-        prefix = prefix_map.get(level, "[ℹ INFO]")
+        prefix = self._PREFIX_MAP.get(level, "[ℹ INFO]")
         print(f"{prefix} {message}")
 
     def display_loading(self, message: str):
@@ -201,12 +228,12 @@ class CLIInterface:
 
     def show_command_help(self):
         """Show available commands."""
-        print("\n" + "=" * 70)
+        print(_HDR_EQ)
         print("  Available Commands")
-        print("=" * 70)
+        print(_HR_EQ)
         for cmd, (description, _) in self.COMMANDS.items():
             print(f"  {cmd:15s} - {description}")
-        print("=" * 70 + "\n")
+        print(_FTR_EQ)
 
     def prompt_for_command(self) -> Optional[str]:
         """
@@ -228,7 +255,7 @@ class CLIInterface:
             if command in self.COMMANDS:
                 return command
             
-            if command in ['q', 'quit', 'exit']:
+            if command in self._EXIT_ALIASES:
                 return 'exit'
             
             print(f"Unknown command '{command}'. Type 'help' for available commands.")
@@ -240,12 +267,12 @@ class CLIInterface:
         Returns:
             'single' for single timeframe, 'multi' for multi-timeframe, None to cancel
         """
-        print("\n" + "=" * 70)
+        print(_HDR_EQ)
         print("  Analysis Mode")
-        print("=" * 70)
+        print(_HR_EQ)
         print("  1. Single Timeframe Analysis (faster)")
         print("  2. Multi-Timeframe Analysis (comprehensive, slower)")
-        print("=" * 70)
+        print(_HR_EQ)
         
         while True:
             choice = input("\nSelect mode (1, 2, or 'q' to cancel): ").strip()
@@ -254,7 +281,7 @@ class CLIInterface:
                 return 'single'
             elif choice == '2':
                 return 'multi'
-            elif choice.lower() in ['q', 'quit']:
+            elif choice.lower() in self._QUIT_ALIASES:
                 return None
             else:
                 print("Please enter 1, 2, or 'q'.")
@@ -266,14 +293,14 @@ class CLIInterface:
         Returns:
             Verbosity level name or None
         """
-        print("\n" + "=" * 70)
+        print(_HDR_EQ)
         print("  Logging Verbosity")
-        print("=" * 70)
+        print(_HR_EQ)
         print("  1. MINIMAL (only errors)")
         print("  2. STANDARD (warnings and errors)")
         print("  3. VERBOSE (all info messages)")
         print("  4. DEBUG (very detailed)")
-        print("=" * 70)
+        print(_HR_EQ)
         
         mapping = {'1': 'MINIMAL', '2': 'STANDARD', '3': 'VERBOSE', '4': 'DEBUG'}
         
@@ -282,7 +309,7 @@ class CLIInterface:
             
             if choice in mapping:
                 return mapping[choice]
-            elif choice.lower() in ['q', 'quit']:
+            elif choice.lower() in self._QUIT_ALIASES:
                 return None
             else:
                 print("Please enter 1, 2, 3, 4, or 'q'.")
@@ -294,14 +321,14 @@ class CLIInterface:
         timeframes: Optional[List[str]] = None
     ):
         """Display currently selected analysis parameters."""
-        print("\n" + "-" * 70)
+        print(_HDR_DASH)
         print("  Current Selection")
-        print("-" * 70)
+        print(_HR_DASH)
         if category:
             print(f"  Category:   {category}")
         if symbols:
             print(f"  Symbols:    {', '.join(symbols)}")
         if timeframes:
             print(f"  Timeframes: {', '.join(timeframes)}")
-        print("-" * 70 + "\n")
+        print(_FTR_DASH)
 
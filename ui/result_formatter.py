@@ -4,11 +4,34 @@ Analysis Result Formatter - Formats and displays multi-timeframe analysis result
 Displays analysis results in clean, readable CLI format with all relevant information.
 """
 
-from typing import Optional, Dict, List
+import sys
+from typing import Optional, Dict, Iterator, List
 from analysis.confluence_engine import ConfluenceResult
 from analysis.multi_timeframe_orchestrator import MultiTimeframeResult
 from mt5.account_monitor import AccountSnapshot
 
+# Horizontal rules shared by every formatted block
+_HR_EQ = '=' * 70
+_HDR_EQ = '\n' + _HR_EQ
+_TABLE_RULE = '  ' + '-' * 66
+_TABLE_HEADER = (
+    f"\n  Timeframe Details:\n{_TABLE_RULE}\n"
+    f"  TF       Bullish  Bearish  Conf.    Bias            Weight\n{_TABLE_RULE}\n"
+)
+
+# Same cap as CLIInterface.display_analysis_result
+_MAX_TOP_FACTORS = 5
+
+# Block characters only when stdout can encode them; '#'/'-' otherwise
+_USE_UTF8 = (getattr(sys.stdout, 'encoding', None) or '').lower().startswith('utf')
+_BAR_FULL, _BAR_EMPTY = ('█', '░') if _USE_UTF8 else ('#', '-')
+
+# Every confidence bar at the default width, indexed by filled cells
+_BAR_WIDTH = 20
+_CONFIDENCE_BARS = tuple(
+    f"[{_BAR_FULL * filled}{_BAR_EMPTY * (_BAR_WIDTH - filled)}]" for filled in range(_BAR_WIDTH + 1)
+)
+
 
 class ResultFormatter:
     """Formats analysis results for display."""
@@ -34,44 +57,39 @@ class ResultFormatter:
         Returns:
             Formatted string for display
         """
-        lines = []
-        
-        # Header
-        header = f"\n{'='*70}"
-        lines.append(header)
         symbol_str = f"{symbol} ({timeframe})"
         if broker:
             symbol_str += f" @ {broker}"
-        lines.append(f"  {symbol_str}")
-        lines.append('='*70)
-        
-        # Market bias
-        lines.append(f"\n  Market Bias: {result.market_bias}")
-        
-        # Scores
-        lines.append(f"\n  Bullish Score:     {result.bullish_score:6.1f}%")
-        lines.append(f"  Bearish Score:     {result.bearish_score:6.1f}%")
-        lines.append(f"  Neutral Prob.:     {result.neutral_probability:6.1f}%")
-        
-        # Confidence
-        conf_bar = ResultFormatter._confidence_bar(result.confidence_percentage)
-        lines.append(f"\n  Confidence:        {result.confidence_percentage:6.1f}%  {conf_bar}")
-        
-        # Signal counts
-        lines.append(f"\n  Total Signals:     {result.signal_count}")
-        lines.append(f"  Bullish Signals:   {result.bullish_signals}")
-        lines.append(f"  Bearish Signals:   {result.bearish_signals}")
+        confidence = result.confidence_percentage
+        conf_bar = ResultFormatter._confidence_bar(confidence)
+        
+        # Header, market bias, scores, confidence and signal counts
+        lines = [
+            _HDR_EQ,
+            f"  {symbol_str}",
+            _HR_EQ,
+            f"\n  Market Bias: {result.market_bias}",
+            f"\n  Bullish Score:     {result.bullish_score:6.1f}%",
+            f"  Bearish Score:     {result.bearish_score:6.1f}%",
+            f"  Neutral Prob.:     {result.neutral_probability:6.1f}%",
+            f"\n  Confidence:        {confidence:6.1f}%  {conf_bar}",
+            f"\n  Total Signals:     {result.signal_count}",
+            f"  Bullish Signals:   {result.bullish_signals}",
+            f"  Bearish Signals:   {result.bearish_signals}",
+        ]
         if result.neutral_signals:
             lines.append(f"  Neutral Signals:   {result.neutral_signals}")
         
         # Top factors
         if show_top_factors and result.top_factors:
             lines.append("\n  Top Contributing Factors:")
-            for i, (source, weight) in enumerate(result.top_factors, 1):
-                lines.append(f"    {i}. {source}: {weight:.2f}")
+            lines.extend(
+                f"    {i}. {source}: {weight:.2f}"
+                for i, (source, weight) in enumerate(result.top_factors[:_MAX_TOP_FACTORS], 1)
+            )
         
         # Warnings
-        if result.confidence_percentage < 40:
+        if confidence < 40:
             lines.append("\n  ⚠ WARNING: Low confidence - results may be unreliable")
         
         lines.append('')  # Blank line
@@ -93,51 +111,52 @@ class ResultFormatter:
         Returns:
             Formatted string for display
         """
-        lines = []
+        return ''.join(ResultFormatter.format_multi_timeframe_result_iter(result, broker))
+    
+    @staticmethod
+    def format_multi_timeframe_result_iter(
+        result: MultiTimeframeResult,
+        broker: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield the multi-timeframe display one newline-terminated line at a time.
+        
+        Suitable for sys.stdout.writelines(), which avoids building the whole
+        block as one string.
         
-        # Header
-        header = f"\n{'='*70}"
-        lines.append(header)
+        Args:
+            result: MultiTimeframeResult object
+            broker: Optional broker name
+            
+        Yields:
+            Lines of the formatted display, each ending in a newline
+        """
         symbol_str = f"{result.symbol} (Multi-Timeframe Analysis)"
         if broker:
             symbol_str += f" @ {broker}"
-        lines.append(f"  {symbol_str}")
-        lines.append('='*70)
-        
-        # Overall bias
-        lines.append(f"\n  Overall Bias:      {result.overall_bias}")
         
-        # Overall scores
-        lines.append(f"\n  Overall Bullish:   {result.overall_bullish:6.1f}%")
-        lines.append(f"  Overall Bearish:   {result.overall_bearish:6.1f}%")
-        lines.append(f"  Overall Conf.:     {result.overall_confidence:6.1f}%")
+        # Header, overall bias and overall scores
+        yield f"{_HDR_EQ}\n"
+        yield f"  {symbol_str}\n"
+        yield f"{_HR_EQ}\n"
+        yield f"\n  Overall Bias:      {result.overall_bias}\n"
+        yield f"\n  Overall Bullish:   {result.overall_bullish:6.1f}%\n"
+        yield f"  Overall Bearish:   {result.overall_bearish:6.1f}%\n"
+        yield f"  Overall Conf.:     {result.overall_confidence:6.1f}%\n"
         
         # Timeframe confluence
         if result.confluence:
             conf_bar = ResultFormatter._confidence_bar(result.confluence)
-            lines.append(f"\n  Timeframe Confluence: {result.confluence:6.1f}%  {conf_bar}")
+            yield f"\n  Timeframe Confluence: {result.confluence:6.1f}%  {conf_bar}\n"
         
         # Per-timeframe details
-        lines.append("\n  Timeframe Details:")
-        lines.append("  " + "-"*66)
-        lines.append("  TF       Bullish  Bearish  Conf.    Bias            Weight")
-        lines.append("  " + "-"*66)
-        
+        yield _TABLE_HEADER
         for tf_bias in result.timeframes:
-            tf_str = f"{tf_bias.timeframe:8s}"
-            bull_str = f"{tf_bias.bullish_score:7.1f}%"
-            bear_str = f"{tf_bias.bearish_score:7.1f}%"
-            conf_str = f"{tf_bias.confidence:6.1f}%"
-            bias_str = f"{tf_bias.bias_direction:15s}"
-            weight_str = f"{tf_bias.weight:.2f}"
-            
-            lines.append(f"  {tf_str} {bull_str} {bear_str} {conf_str} {bias_str} {weight_str}")
-        
-        lines.append("  " + "-"*66)
-        
-        lines.append('')  # Blank line
-        
-        return '\n'.join(lines)
+            yield (
+                f"  {tf_bias.timeframe:8s} {tf_bias.bullish_score:7.1f}% {tf_bias.bearish_score:7.1f}% "
+                f"{tf_bias.confidence:6.1f}% {tf_bias.bias_direction:15s} {tf_bias.weight:.2f}\n"
+            )
+        yield f"{_TABLE_RULE}\n"
     
     @staticmethod
     def format_account_info(snapshot: AccountSnapshot) -> str:
@@ -150,67 +169,50 @@ class ResultFormatter:
         Returns:
             Formatted string for display
         """
-        lines = []
-        
-        header = f"\n{'='*70}"
-        lines.append(header)
-        lines.append(f"  Account Information")
-        lines.append('='*70)
-        
-        lines.append(f"\n  Login:              {snapshot.login}")
-        lines.append(f"  Name:               {snapshot.name}")
-        lines.append(f"  Company:            {snapshot.company}")
-        lines.append(f"  Server:             {snapshot.server}")
-        lines.append(f"  Currency:           {snapshot.currency}")
-        
-        lines.append(f"\n  Balance:            {snapshot.balance:15.2f} {snapshot.currency}")
-        lines.append(f"  Equity:             {snapshot.equity:15.2f} {snapshot.currency}")
-        lines.append(f"  Margin Level:       {snapshot.margin_level:15.2f}%")
-        
-        lines.append(f"\n  Last Update:        {snapshot.timestamp}")
-        
-        lines.append('')  # Blank line
-        
-        return '\n'.join(lines)
+        currency = snapshot.currency
+        return '\n'.join((
+            _HDR_EQ,
+            "  Account Information",
+            _HR_EQ,
+            f"\n  Login:              {snapshot.login}",
+            f"  Name:               {snapshot.name}",
+            f"  Company:            {snapshot.company}",
+            f"  Server:             {snapshot.server}",
+            f"  Currency:           {currency}",
+            f"\n  Balance:            {snapshot.balance:15.2f} {currency}",
+            f"  Equity:             {snapshot.equity:15.2f} {currency}",
+            f"  Margin Level:       {snapshot.margin_level:15.2f}%",
+            f"\n  Last Update:        {snapshot.timestamp}",
+            '',  # Blank line
+        ))
     
     @staticmethod
     def format_error(error_message: str) -> str:
         """Format error message for display."""
-        lines = []
-        lines.append(f"\n{'='*70}")
-        lines.append(f"  ❌ ERROR")
-        lines.append('='*70)
-        lines.append(f"\n  {error_message}")
-        lines.append('')
-        return '\n'.join(lines)
+        return ResultFormatter._format_banner("❌ ERROR", error_message)
     
     @staticmethod
     def format_warning(warning_message: str) -> str:
         """Format warning message for display."""
-        lines = []
-        lines.append(f"\n{'='*70}")
-        lines.append(f"  ⚠ WARNING")
-        lines.append('='*70)
-        lines.append(f"\n  {warning_message}")
-        lines.append('')
-        return '\n'.join(lines)
+        return ResultFormatter._format_banner("⚠ WARNING", warning_message)
     
     @staticmethod
     def format_info(info_message: str) -> str:
         """Format info message for display."""
-        lines = []
-        lines.append(f"\n{'='*70}")
-        lines.append(f"  ℹ INFO")
-        lines.append('='*70)
-        lines.append(f"\n  {info_message}")
-        lines.append('')
-        return '\n'.join(lines)
+        return ResultFormatter._format_banner("ℹ INFO", info_message)
+    
+    @staticmethod
+    def _format_banner(title: str, message: str) -> str:
+        """Format a titled message block (error, warning, info)."""
+        return f"{_HDR_EQ}\n  {title}\n{_HR_EQ}\n\n  {message}\n"
     
     @staticmethod
-    def _confidence_bar(confidence: float, width: int = 20) -> str:
+    def _confidence_bar(confidence: float, width: int = _BAR_WIDTH) -> str:
         """Generate ASCII confidence bar."""
         filled = int((confidence / 100.0) * width)
-        bar = "█" * filled + "░" * (width - filled)
+        if width == _BAR_WIDTH and 0 <= filled <= _BAR_WIDTH:
+            return _CONFIDENCE_BARS[filled]
+        bar = _BAR_FULL * filled + _BAR_EMPTY * (width - filled)
         return f"[{bar}]"
     
     @staticmethod
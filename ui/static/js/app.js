@@ -26,7 +26,7 @@ document.addEventListener('DOMContentLoaded', function(){
         const sym = symbolSelect.value || (s.symbols && s.symbols[0] && s.symbols[0].name) || '';
         if(sym){
           const c = await safeFetch(`/candles?symbol=${encodeURIComponent(sym)}&timeframe=${encodeURIComponent(document.getElementById('timeframe').value)}&count=200`);
-          if(c && c.candles){ updateChartWithLive({candles: c.candles}); }
+          if(c && c.candles){ updateChartWithLive({candles: candleRows(c.candles)}); }
         }
       }catch(e){ console.warn('failed initial candles', e); }
     }
@@ -59,10 +59,14 @@ document.addEventListener('DOMContentLoaded', function(){
   // Open WebSocket and handle live updates
   function initWebSocket(){
     const ws = new WebSocket(`ws://${location.host}/ws`);
+    // Broadcasts arrive as UTF-8 JSON in binary frames
+    ws.binaryType = 'arraybuffer';
+    const utf8 = new TextDecoder();
     ws.onopen = ()=> console.log('ws open');
     ws.onmessage = function(evt){
       try{
-        const msg = JSON.parse(evt.data);
+        const text = typeof evt.data === 'string' ? evt.data : utf8.decode(evt.data);
+        const msg = JSON.parse(text);
         if(msg.type === 'analysis_update'){
           const res = msg.result;
           renderSignals(res);
@@ -124,6 +128,20 @@ document.addEventListener('DOMContentLoaded', function(){
   initChartWhenReady();
   initWebSocket();
 
+  // /candles sends one array per column; rebuild the per-bar objects the chart uses
+  function candleRows(cols){
+    if(Array.isArray(cols)) return cols;
+    const keys = Object.keys(cols || {});
+    const n = keys.length ? cols[keys[0]].length : 0;
+    const rows = new Array(n);
+    for(let i = 0; i < n; i++){
+      const r = {};
+      for(const k of keys) r[k] = cols[k][i];
+      rows[i] = r;
+    }
+    return rows;
+  }
+
   function toCandlePoint(r){
     const ts = Math.floor(new Date(r.Timestamp || r.timestamp).getTime() / 1000);
     return {time: ts, open: r.Open != null ? r.Open : r.open, high: r.High != null ? r.High : r.high, low: r.Low != null ? r.Low : r.low, close: r.Close != null ? r.Close : r.close};
@@ -4,8 +4,10 @@ from __future__ import annotations
 import os
 import sys
 import json
+import hashlib
 import threading
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, Tuple
 
 # Ensure the project root (the `trader` folder) is on sys.path so imports like
 # `analysis` and `mt5` resolve when running the webapp.
@@ -17,36 +19,99 @@ if PROJECT_ROOT not in sys.path:
 import uvicorn
 import asyncio
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.websockets import WebSocketState
+from pandas.api.types import is_datetime64_any_dtype
 
 from analysis.engine import AnalysisEngine
 from mt5.connector import MT5Connector
+from mt5.market_data import MarketDataManager
 from core.logger import get_logger
+from config.settings import UI_CONFIG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# WebSocket clients sent to per event-loop turn during a broadcast
+BROADCAST_BATCH_SIZE = 50
+# Updates arriving within this window of each other are coalesced before a broadcast
+BROADCAST_DEBOUNCE_SECONDS = 0.1
+
+# Serialized /candles responses: (symbol, timeframe, count) -> (monotonic time, JSON bytes)
+CANDLES_TTL_SECONDS = 1.0
+CANDLES_CACHE_MAX_ENTRIES = 256
+CANDLES_CACHE: Dict[Tuple[str, str, int], Tuple[float, bytes]] = {}
+CANDLES_LOCKS: Dict[Tuple[str, str, int], asyncio.Lock] = {}
+
+# Browser cache lifetime for /static assets and the favicon. Not 'immutable':
+# asset URLs are unversioned, so browsers must still revalidate after a day.
+STATIC_CACHE_CONTROL = 'public, max-age=86400'
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=str).encode('utf-8')
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets instead of refetching each load.
+
+    The header is set on the FileResponse itself rather than by HTTP middleware,
+    which would stream every file body back through Python.
+    """
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault('Cache-Control', STATIC_CACHE_CONTROL)
+        return response
 
 
 class WebSocketManager:
     def __init__(self):
-        self.active: List[WebSocket] = []
+        # Keyed by id(): Starlette's WebSocket is a Mapping, so it is unhashable
+        # and list membership would compare whole ASGI scopes
+        self.active: Dict[int, WebSocket] = {}
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.active.append(ws)
+        self.active[id(ws)] = ws
 
     def disconnect(self, ws: WebSocket):
-        if ws in self.active:
-            self.active.remove(ws)
+        self.active.pop(id(ws), None)
 
     async def broadcast(self, message: Dict[str, Any]):
-        dead = []
-        data = json.dumps(message, default=str)
-        for ws in list(self.active):
-            try:
-                await ws.send_text(data)
-            except Exception:
-                dead.append(ws)
-        for d in dead:
-            self.disconnect(d)
+        # Encode once and send the same bytes to every client; send_text would
+        # re-encode the payload per connection
+        data = _json_bytes(message)
+        # Sends within a batch run concurrently; between batches the loop gets
+        # a turn so HTTP handlers stay responsive with many subscribers
+        clients = []
+        for ws in list(self.active.values()):
+            # Sockets already known to be closed are dropped without attempting
+            # a send that could only fail
+            if (ws.client_state == WebSocketState.CONNECTED
+                    and ws.application_state == WebSocketState.CONNECTED):
+                clients.append(ws)
+            else:
+                self.disconnect(ws)
+        for start in range(0, len(clients), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = clients[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(ws.send_bytes(data) for ws in batch), return_exceptions=True
+            )
+            for ws, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self.disconnect(ws)
 
 
 app = FastAPI()
@@ -57,41 +122,109 @@ if not os.path.exists(static_dir):
         os.makedirs(static_dir)
     except Exception:
         pass
-app.mount('/static', StaticFiles(directory=static_dir), name='static')
+app.mount('/static', CachedStaticFiles(directory=static_dir), name='static')
 logger = get_logger()
 ws_mgr = WebSocketManager()
-engine = AnalysisEngine()
+# One manager for the engine and every /candles request, so they share its data
+# cache and in-flight fetches; get_candles revalidates against the latest tick
+md_mgr = MarketDataManager()
+engine = AnalysisEngine(market_data=md_mgr)
 connector = MT5Connector()
 MAIN_LOOP = None
 
+# Static file locations, resolved once at import rather than probed per request
+INDEX_TEMPLATE_PATH = os.path.join(THIS_DIR, 'templates', 'index.html')
+if not os.path.exists(INDEX_TEMPLATE_PATH):
+    # Fallback to project-root relative path
+    INDEX_TEMPLATE_PATH = os.path.join(PROJECT_ROOT, 'ui', 'templates', 'index.html')
+FAVICON_PATH = os.path.join(THIS_DIR, 'wxJWxaU6_big.png')
+FAVICON_MEDIA_TYPE = 'image/png'
+if not os.path.exists(FAVICON_PATH):
+    FAVICON_PATH = os.path.join(THIS_DIR, 'static', 'css', 'styles.css')
+    FAVICON_MEDIA_TYPE = None
+try:
+    # Handed to FileResponse so each request skips its own stat
+    FAVICON_STAT = os.stat(FAVICON_PATH)
+except OSError:
+    FAVICON_STAT = None
+BROADCAST_Q = None
+_BROADCAST_TASK = None
+_NO_LOOP_WARNED = False
+INDEX_HTML = None
+INDEX_ETAG = None
+
 
 @app.on_event('startup')
 async def _capture_loop():
-    global MAIN_LOOP
+    global MAIN_LOOP, BROADCAST_Q, _BROADCAST_TASK
     try:
-        MAIN_LOOP = asyncio.get_event_loop()
+        MAIN_LOOP = asyncio.get_running_loop()
+        if sys.version_info >= (3, 12):
+            # Tasks that finish without suspending (most small sends) run inline
+            MAIN_LOOP.set_task_factory(asyncio.eager_task_factory)
+        BROADCAST_Q = asyncio.Queue()
+        _BROADCAST_TASK = asyncio.ensure_future(_broadcast_consumer())
         logger.debug('Captured main asyncio loop for cross-thread scheduling')
     except Exception:
         logger.exception('Failed to capture main loop')
 
 
+def _update_key(payload: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Key an analysis_update payload by the symbol and timeframe it describes."""
+    result = payload.get('result')
+    if not isinstance(result, dict):
+        return (None, None)
+    return (result.get('symbol'), result.get('timeframe'))
+
+
+async def _broadcast_consumer():
+    """Broadcast engine updates queued by the engine."""
+    while True:
+        payload = await BROADCAST_Q.get()
+        # Let a burst accumulate, then send only the latest update per
+        # (symbol, timeframe); each one supersedes the ones before it
+        await asyncio.sleep(BROADCAST_DEBOUNCE_SECONDS)
+        latest = {_update_key(payload): payload}
+        while not BROADCAST_Q.empty():
+            payload = BROADCAST_Q.get_nowait()
+            latest[_update_key(payload)] = payload
+        for payload in latest.values():
+            try:
+                await ws_mgr.broadcast(payload)
+            except Exception:
+                logger.exception('Failed to broadcast update')
+
+
+def _load_index_html() -> None:
+    """Read the dashboard template once; restart the server to pick up edits."""
+    global INDEX_HTML, INDEX_ETAG
+    with open(INDEX_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+        INDEX_HTML = f.read()
+    INDEX_ETAG = '"' + hashlib.md5(INDEX_HTML.encode('utf-8')).hexdigest() + '"'
+
+
+@app.on_event('startup')
+async def _cache_index():
+    try:
+        _load_index_html()
+    except Exception:
+        logger.exception('Failed to load index template')
+
+
 @app.get('/', response_class=HTMLResponse)
 async def index(request: Request):
-    tpl_path = os.path.join(THIS_DIR, 'templates', 'index.html')
-    if not os.path.exists(tpl_path):
-        # Fallback to project-root relative path
-        tpl_path = os.path.join(PROJECT_ROOT, 'ui', 'templates', 'index.html')
-    html = open(tpl_path, 'r', encoding='utf-8').read()
-    return HTMLResponse(html)
+    if INDEX_HTML is None:
+        _load_index_html()
+    if request.headers.get('if-none-match') == INDEX_ETAG:
+        return Response(status_code=304, headers={'ETag': INDEX_ETAG})
+    return HTMLResponse(INDEX_HTML, headers={'ETag': INDEX_ETAG})
 
 
 @app.get('/favicon.ico')
 async def favicon():
     # Serve an existing image as favicon to avoid 404 noise
-    cand = os.path.join(THIS_DIR, 'wxJWxaU6_big.png')
-    if os.path.exists(cand):
-        return FileResponse(cand, media_type='image/png')
-    return FileResponse(os.path.join(THIS_DIR, 'static', 'css', 'styles.css'))
+    return FileResponse(FAVICON_PATH, media_type=FAVICON_MEDIA_TYPE, stat_result=FAVICON_STAT,
+                        headers={'Cache-Control': STATIC_CACHE_CONTROL})
 
 
 @app.post('/start')
@@ -106,24 +239,35 @@ async def start(payload: Dict[str, Any]):
 
     def _cb(result):
         # Schedule broadcast in main event loop if available (safe from background thread)
+        global _NO_LOOP_WARNED
         try:
             payload = {'type': 'analysis_update', 'result': result}
-            if MAIN_LOOP is not None and MAIN_LOOP.is_running():
-                try:
-                    asyncio.run_coroutine_threadsafe(ws_mgr.broadcast(payload), MAIN_LOOP)
-                except Exception:
-                    logger.exception('Failed to schedule broadcast on main loop')
+            if MAIN_LOOP is None or not MAIN_LOOP.is_running():
+                # No clients can be connected without the server loop; drop the update
+                if not _NO_LOOP_WARNED:
+                    _NO_LOOP_WARNED = True
+                    logger.warning('Main loop not running; dropping analysis updates')
+                return
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is MAIN_LOOP:
+                # Already on the loop thread: no cross-thread hand-off needed
+                BROADCAST_Q.put_nowait(payload)
             else:
-                # Fallback: try running directly (may block)
-                try:
-                    asyncio.run(ws_mgr.broadcast(payload))
-                except Exception:
-                    logger.exception('Failed to run broadcast coroutine')
+                MAIN_LOOP.call_soon_threadsafe(BROADCAST_Q.put_nowait, payload)
         except Exception:
             logger.exception('Failed to broadcast update')
 
-    # Start engine in background thread
-    engine.start(symbol, timeframe, history_days=history_days, poll_interval=poll_interval, update_cb=_cb)
+    if UI_CONFIG.get('web_engine_in_server_loop', True):
+        # Engine shares this loop: updates reach BROADCAST_Q without a thread hop
+        asyncio.ensure_future(engine.start_async(
+            symbol, timeframe, history_days=history_days, poll_interval=poll_interval, update_cb=_cb
+        ))
+    else:
+        # Start engine in background thread
+        engine.start(symbol, timeframe, history_days=history_days, poll_interval=poll_interval, update_cb=_cb)
     return {'status': 'started', 'symbol': symbol, 'timeframe': timeframe}
 
 
@@ -154,23 +298,48 @@ async def connection_status():
 async def candles(symbol: str, timeframe: str = 'M15', count: int = 200):
     """Return recent candles for a symbol/timeframe (used by the UI to render charts).
 
-    Tries cached data first, then fetches from MT5 if needed.
+    Served from the shared MarketDataManager cache while it is current, otherwise
+    fetched from MT5. Candles are returned column-wise:
+    ``{'candles': {'Timestamp': [...], 'Open': [...], ...}}``.
     """
-    try:
-        from mt5.market_data import MarketDataManager
-        md = MarketDataManager()
-        cached = md.get_cached_data(symbol, timeframe)
-        if cached is not None and len(cached) > 0:
-            df = cached.tail(count).copy()
-        else:
-            df = md.get_candles(symbol, timeframe, count)
+    # UI refresh bursts ask for the same candles repeatedly; serve those from a
+    # short-lived cache of the serialized response
+    key = (symbol, timeframe, count)
+    hit = CANDLES_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < CANDLES_TTL_SECONDS:
+        return Response(content=hit[1], media_type='application/json')
+
+    # Concurrent misses for the same key wait for one computation
+    async with CANDLES_LOCKS.setdefault(key, asyncio.Lock()):
+        hit = CANDLES_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < CANDLES_TTL_SECONDS:
+            return Response(content=hit[1], media_type='application/json')
+        try:
+            # Serves the shared cache only while it is current and holds count
+            # bars, topping up or reloading from MT5 otherwise. The MT5 calls run
+            # in the executor so the engine task and broadcasts keep running.
+            df = await md_mgr.get_candles_async(symbol, timeframe, count)
             if df is None:
                 return {'error': 'no_data'}
-        df['Timestamp'] = df['Timestamp'].astype(str)
-        return {'candles': df.to_dict(orient='records')}
-    except Exception:
-        logger.exception('Failed to return candles')
-        return {'error': 'exception'}
+            ts = df['Timestamp']
+            if is_datetime64_any_dtype(ts):
+                # Vectorized; same text as astype(str) for whole-second bars
+                df['Timestamp'] = ts.dt.strftime('%Y-%m-%d %H:%M:%S')
+            else:
+                df['Timestamp'] = ts.astype(str)
+            # Columnar: one array per column instead of repeating every key per bar
+            payload = _json_bytes({'candles': {col: df[col].tolist() for col in df.columns}})
+        except Exception:
+            logger.exception('Failed to return candles')
+            return {'error': 'exception'}
+
+        now = time.monotonic()
+        if len(CANDLES_CACHE) >= CANDLES_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (ts, _) in CANDLES_CACHE.items() if now - ts >= CANDLES_TTL_SECONDS]:
+                del CANDLES_CACHE[stale]
+                CANDLES_LOCKS.pop(stale, None)
+        CANDLES_CACHE[key] = (now, payload)
+        return Response(content=payload, media_type='application/json')
 
 
 @app.post('/stop')
@@ -183,7 +352,7 @@ async def stop():
 async def status():
     try:
         return {
-            'running': bool(engine._thread is not None and engine._thread.is_alive()),
+            'running': engine.is_running(),
             'connected': bool(connector.is_connected())
         }
     except Exception:
@@ -196,17 +365,22 @@ async def websocket_endpoint(ws: WebSocket):
     await ws_mgr.connect(ws)
     try:
         while True:
-            # Keep connection alive; client may send pings or commands
-            msg = await ws.receive_text()
-            # No-op echo for now
-            await ws.send_text(json.dumps({'type': 'echo', 'payload': msg}))
+            # Drain client messages so disconnects are noticed; nothing is sent
+            # back, as protocol-level ping/pong already keeps the socket alive
+            await ws.receive_text()
     except WebSocketDisconnect:
         ws_mgr.disconnect(ws)
 
 
 def run(host: str = '0.0.0.0', port: int = 8000):
-    # Run uvicorn in-process to make starting from python easy
-    uvicorn.run(app, host=host, port=port, log_level='info')
+    # Run uvicorn in-process to make starting from python easy.
+    # 'auto' selects uvloop/httptools when installed (uvicorn[standard] pulls
+    # them in on Linux/macOS) and falls back to asyncio/h11 on Windows, where
+    # uvloop does not exist. permessage-deflate is negotiated with clients that
+    # offer it, which shrinks the repetitive JSON of analysis updates on the wire.
+    uvicorn.run(app, host=host, port=port, log_level='info',
+                loop='auto', http='auto', ws='auto',
+                ws_per_message_deflate=True)
 
 
 if __name__ == '__main__':